@@ -2,22 +2,28 @@
 Main CLI application.
 """
 import sys
-import webbrowser
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, TextIO
 
 from ..config.settings import Settings
 from ..models.archive import ArchiveRequest
 from ..models.auth import AuthCredentials
 from ..models.spot import Spot
-from ..services.archive_service import ArchiveService
+from ..models.weather import DateRange, WeatherModel
+from ..services._http import create_session
 from ..services.auth_service import AuthService
 from ..services.credential_storage import CredentialStorage
 from ..services.spot_service import SpotService
-from ..services.visualization_service import VisualizationService
+from ..services.weather_cache import WeatherCache
 from ..utils.stats_utils import print_weather_stats
 from .formatter import CLIFormatter
 from .prompts import CredentialsPrompt, DateRangePrompt, ModelPrompt, SpotPrompt
 
+if TYPE_CHECKING:
+    # Imported lazily at runtime: these pull in pandas/lxml/plotly
+    from ..services.archive_service import ArchiveService
+    from ..services.visualization_service import VisualizationService
+
 
 class WindguruCLI:
     """Main CLI application orchestrator."""
@@ -32,18 +38,20 @@ class WindguruCLI:
         self.settings = settings or Settings.load()
         self.fmt = CLIFormatter()
         self.credentials: Optional[AuthCredentials] = None
+        self.interactive = sys.stdin.isatty()
+        self._stdout: TextIO = sys.stdout
 
         # Services (initialized after authentication)
         self.auth_service: Optional[AuthService] = None
         self.spot_service: Optional[SpotService] = None
         self.archive_service: Optional[ArchiveService] = None
         self.viz_service: Optional[VisualizationService] = None
+        self.cache = WeatherCache(self.settings.cache_path, self.settings.cache_ttl_seconds)
 
     def print_banner(self) -> None:
         """Print application banner."""
-        print("\n" + "🌊" * 30)
-        print(" " * 20 + "WINDGURU DATA ANALYZER")
-        print("🌊" * 30 + "\n")
+        waves = "🌊" * 30
+        self._stdout.write(f"\n{waves}\n{' ' * 20}WINDGURU DATA ANALYZER\n{waves}\n\n")
 
     def authenticate(self) -> bool:
         """
@@ -53,6 +61,8 @@ class WindguruCLI:
             True if authentication successful
         """
         email, password, manual_creds, method = CredentialsPrompt.prompt()
+        # One session per login, so cookies never carry over from another user
+        session = create_session()
 
         if method in ('auto', 'auto-save'):
             # Auto-login
@@ -60,7 +70,7 @@ class WindguruCLI:
                 print(self.fmt.error("Email and password are required for auto-login"))
                 return False
 
-            self.auth_service = AuthService()
+            self.auth_service = AuthService(session)
             print(f"\n{self.fmt.working('Connecting to Windguru...')}")
 
             response = self.auth_service.login(email, password)
@@ -90,7 +100,7 @@ class WindguruCLI:
                 return False
 
             self.credentials = manual_creds
-            self.auth_service = AuthService()
+            self.auth_service = AuthService(session)
 
             print(f"\n{self.fmt.working('Validating credentials...')}")
             if not self.auth_service.validate_credentials(self.credentials):
@@ -112,7 +122,7 @@ class WindguruCLI:
                 return False
 
             self.credentials = manual_creds
-            self.auth_service = AuthService()
+            self.auth_service = AuthService(session)
             print(self.fmt.success("Using saved credentials!"))
             print(f"\n{self.fmt.working('Validating credentials...')}")
 
@@ -132,9 +142,14 @@ class WindguruCLI:
             return False
 
         # Initialize services
-        self.spot_service = SpotService(self.credentials)
-        self.archive_service = ArchiveService(self.credentials)
-        self.viz_service = VisualizationService(self.settings.output_dir)
+        from ..services.archive_service import ArchiveService
+        from ..services.visualization_service import VisualizationService
+
+        self.spot_service = SpotService(self.credentials, session)
+        self.archive_service = ArchiveService(self.credentials, session)
+        self.viz_service = VisualizationService(
+            self.settings.output_dir, write_gzip=self.settings.write_gzip
+        )
 
         # Establish session
         if not self.auth_service:
@@ -172,7 +187,10 @@ class WindguruCLI:
                 print(self.fmt.error("No spots found. Try a different search term."))
                 continue
 
-            spot = SpotPrompt.display_results(results.spots)
+            if self.interactive:
+                spot = SpotPrompt.display_results(results.spots)
+            else:
+                spot = SpotPrompt.select_batch(results.spots)
             if spot:
                 return spot
             # If None, loop to search again
@@ -185,27 +203,80 @@ class WindguruCLI:
             if not spot:
                 return False
 
-            # Select model
-            model = ModelPrompt.prompt()
-
-            # Get date range
-            date_range = DateRangePrompt.prompt()
-
-            # Fetch data
-            print(self.fmt.header("FETCHING DATA"))
-            print(f"Spot: {spot.name}")
-            print(f"Model: {model.name}")
-            print(f"Date Range: {date_range}")
-            print(f"\n{self.fmt.working('Fetching data from Windguru (this may take a moment)...')}\n")
-
-            request = ArchiveRequest.create(
-                spot_id=spot.id,
-                model_id=model.id,
-                date_range=date_range,
-                include_wind=True,
-                include_temp=True
-            )
+            # Warm up the archive session while the user answers the prompts
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                prefetch = None
+                if self.archive_service:
+                    prefetch = executor.submit(
+                        self.archive_service.prefetch_session,
+                        self.settings.timeout_seconds
+                    )
+
+                # Select model(s); piped input may request several at once
+                if self.interactive:
+                    models = [ModelPrompt.prompt()]
+                else:
+                    models = ModelPrompt.prompt_batch()
+
+                # Get date range
+                date_range = DateRangePrompt.prompt()
+
+                prefetched = False
+                if prefetch:
+                    try:
+                        prefetched = prefetch.result(timeout=self.settings.timeout_seconds)
+                    except Exception:
+                        prefetched = False
+
+            for model in models:
+                if not self.process_model(spot, model, date_range, prefetched):
+                    return False
+
+            return True
 
+        except Exception as e:
+            print(self.fmt.error(f"Error: {e}"))
+            if self.settings.verbose:
+                import traceback
+                traceback.print_exc()
+            return False
+
+    def process_model(self, spot: Spot, model: WeatherModel, date_range: DateRange,
+                      prefetched: bool = False) -> bool:
+        """
+        Fetch data for one model and create its dashboard.
+
+        Args:
+            spot: Selected spot
+            model: Weather model to fetch
+            date_range: Date range to fetch
+            prefetched: Archive session was already established
+
+        Returns:
+            True if the dashboard was created
+        """
+        # Fetch data
+        print(
+            f"{self.fmt.header('FETCHING DATA')}\n"
+            f"Spot: {spot.name}\n"
+            f"Model: {model.name}\n"
+            f"Date Range: {date_range}\n"
+            f"\n{self.fmt.working('Fetching data from Windguru (this may take a moment)...')}\n"
+        )
+
+        request = ArchiveRequest.create(
+            spot_id=spot.id,
+            model_id=model.id,
+            date_range=date_range,
+            include_wind=True,
+            include_temp=True
+        )
+
+        cached = self.cache.load(request)
+        if cached is not None and self.cache.is_fresh(request):
+            weather_data = cached
+            print(self.fmt.info("Using cached data from a previous run"))
+        else:
             if not self.archive_service:
                 print(self.fmt.error("Archive service not initialized"))
                 return False
@@ -213,47 +284,52 @@ class WindguruCLI:
             weather_data = self.archive_service.get_weather_data(
                 request,
                 spot_name=spot.name,
-                model_name=model.name
+                model_name=model.name,
+                cached=cached,
+                prefetched=prefetched
             )
+            if weather_data is cached:
+                self.cache.touch(request)
+                print(self.fmt.info("Archive unchanged since last run, using cached data"))
+            else:
+                self.cache.save(request, weather_data)
 
-            print(self.fmt.success(f"Successfully fetched {weather_data.record_count} data points!"))
+        print(self.fmt.success(f"Successfully fetched {weather_data.record_count} data points!"))
 
-            # Display statistics
-            print_weather_stats(weather_data)
+        # Display statistics
+        print_weather_stats(weather_data)
 
-            # Create visualization
-            print(self.fmt.header("CREATING VISUALIZATION"))
-            print()
+        # Create visualization
+        print(self.fmt.header("CREATING VISUALIZATION"))
+        print()
 
-            if not self.viz_service:
-                print(self.fmt.error("Visualization service not initialized"))
-                return False
+        if not self.viz_service:
+            print(self.fmt.error("Visualization service not initialized"))
+            return False
 
-            print("📊 Creating interactive dashboard...")
-            dashboard_file = self.viz_service.create_dashboard(weather_data)
+        print("📊 Creating interactive dashboard...")
+        dashboard_file = self.viz_service.create_dashboard(weather_data)
+        abs_url = f"file://{dashboard_file.absolute()}"
 
-            # Display results
-            print(self.fmt.header("SUCCESS!"))
-            print(f"\n📊 Dashboard: file://{dashboard_file.absolute()}")
-            print(self.fmt.section_break())
+        # Display results
+        print(
+            f"{self.fmt.header('SUCCESS!')}\n"
+            f"\n📊 Dashboard: {abs_url}\n"
+            f"{self.fmt.section_break()}"
+        )
 
-            # Offer to open in browser
+        # Offer to open in browser (interactive sessions only)
+        if self.interactive:
             try:
                 open_browser = input("Open dashboard in browser now? (y/n): ").strip().lower()
                 if open_browser == 'y':
-                    webbrowser.open(f"file://{dashboard_file.absolute()}")
+                    import webbrowser
+                    webbrowser.open(abs_url)
                     print(self.fmt.success("Opened in browser!"))
             except (KeyboardInterrupt, EOFError):
                 pass
 
-            return True
-
-        except Exception as e:
-            print(self.fmt.error(f"Error: {e}"))
-            if self.settings.verbose:
-                import traceback
-                traceback.print_exc()
-            return False
+        return True
 
     def run(self) -> None:
         """Run the CLI application."""
@@ -2,41 +2,55 @@
 CLI formatting utilities.
 """
 
+DEFAULT_WIDTH = 60
+
+_SUCCESS_PREFIX = "✅ "
+_ERROR_PREFIX = "❌ "
+_INFO_PREFIX = "ℹ️  "
+_WORKING_PREFIX = "🔄 "
+
 
 class CLIFormatter:
     """Handles formatting of CLI output."""
 
-    @staticmethod
-    def header(text: str, width: int = 60) -> str:
+    # Borders for the default width, built once instead of on every call
+    _BORDER = "=" * DEFAULT_WIDTH
+    _SUBBORDER = "-" * DEFAULT_WIDTH
+
+    @classmethod
+    def header(cls, text: str, width: int = DEFAULT_WIDTH) -> str:
         """Create a header."""
-        return f"\n{'=' * width}\n{text}\n{'=' * width}"
+        border = cls._BORDER if width == DEFAULT_WIDTH else '=' * width
+        return f"\n{border}\n{text}\n{border}"
 
-    @staticmethod
-    def subheader(text: str, width: int = 60) -> str:
+    @classmethod
+    def subheader(cls, text: str, width: int = DEFAULT_WIDTH) -> str:
         """Create a subheader."""
-        return f"\n{'-' * width}\n{text}\n{'-' * width}"
+        border = cls._SUBBORDER if width == DEFAULT_WIDTH else '-' * width
+        return f"\n{border}\n{text}\n{border}"
 
     @staticmethod
     def success(message: str) -> str:
         """Format success message."""
-        return f"✅ {message}"
+        return _SUCCESS_PREFIX + message
 
     @staticmethod
     def error(message: str) -> str:
         """Format error message."""
-        return f"❌ {message}"
+        return _ERROR_PREFIX + message
 
     @staticmethod
     def info(message: str) -> str:
         """Format info message."""
-        return f"ℹ️  {message}"
+        return _INFO_PREFIX + message
 
     @staticmethod
     def working(message: str) -> str:
         """Format working/progress message."""
-        return f"🔄 {message}"
+        return _WORKING_PREFIX + message
 
-    @staticmethod
-    def section_break(width: int = 60) -> str:
+    @classmethod
+    def section_break(cls, width: int = DEFAULT_WIDTH) -> str:
         """Create a section break."""
-        return "\n" + "=" * width + "\n"
+        border = cls._BORDER if width == DEFAULT_WIDTH else '=' * width
+        return f"\n{border}\n"
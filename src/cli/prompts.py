@@ -4,7 +4,7 @@ CLI prompt handlers.
 import getpass
 from typing import Optional
 
-from ..config.constants import WEATHER_MODELS
+from ..config.constants import WEATHER_MODEL_OBJECTS
 from ..models.auth import AuthCredentials
 from ..models.spot import Spot
 from ..models.weather import DateRange, WeatherModel
@@ -183,6 +183,46 @@ class SpotPrompt:
             except ValueError:
                 print(fmt.error("Please enter a valid number"))
 
+    @staticmethod
+    def select_batch(spots: list[Spot]) -> Optional[Spot]:
+        """
+        Read a single spot choice from non-interactive input.
+
+        Unlike display_results, an invalid choice is not re-prompted, so
+        piped input lines are never consumed by a retry loop.
+
+        Args:
+            spots: List of spots to choose from
+
+        Returns:
+            Selected spot or None if user wants to search again
+
+        Raises:
+            ValueError: If the choice is not a valid spot number
+        """
+        fmt = CLIFormatter()
+
+        # List the spots so a log of the run shows what the choice refers to
+        print(f"\n{fmt.success(f'Found {len(spots)} spots:')}\n")
+        for i, spot in enumerate(spots, 1):
+            print(f"  {i}. {spot}")
+        print("\n  0. Search again")
+
+        choice = input().strip()
+        try:
+            choice_num = int(choice)
+        except ValueError:
+            raise ValueError(f"Invalid spot choice: {choice!r}") from None
+
+        if choice_num == 0:
+            return None
+        if not 1 <= choice_num <= len(spots):
+            raise ValueError(f"Spot choice must be between 0 and {len(spots)}, got {choice_num}")
+
+        selected = spots[choice_num - 1]
+        print(fmt.success(f"Selected: {selected.name}"))
+        return selected
+
 
 class DateRangePrompt:
     """Handles date range input from user."""
@@ -231,15 +271,7 @@ class ModelPrompt:
         print(fmt.header("WEATHER MODEL"))
         print("Choose a weather model:\n")
 
-        models = [
-            WeatherModel(
-                id=m['id'],  # type: ignore[arg-type]
-                name=m['name'],  # type: ignore[arg-type]
-                resolution=m.get('resolution'),  # type: ignore[arg-type]
-                coverage=m.get('coverage')  # type: ignore[arg-type]
-            )
-            for m in WEATHER_MODELS
-        ]
+        models = WEATHER_MODEL_OBJECTS
 
         for i, model in enumerate(models, 1):
             print(f"  {i}. {model.name}")
@@ -262,3 +294,36 @@ class ModelPrompt:
                     print(fmt.error(f"Please enter a number between 1 and {len(models)}"))
             except ValueError:
                 print(fmt.error("Please enter a valid number"))
+
+    @staticmethod
+    def prompt_batch() -> list[WeatherModel]:
+        """
+        Read one or more model choices from a single non-interactive line.
+
+        The line holds comma-separated model numbers (e.g. ``1,3``); an empty
+        line selects the default model. All choices are validated before any
+        is returned.
+
+        Returns:
+            Selected WeatherModels in input order
+
+        Raises:
+            ValueError: If any choice is not a valid model number
+        """
+        models = WEATHER_MODEL_OBJECTS
+        line = input().strip()
+        if not line:
+            return [models[0]]
+
+        selected = []
+        for part in line.split(','):
+            try:
+                choice_num = int(part)
+            except ValueError:
+                raise ValueError(f"Invalid model choice: {part.strip()!r}") from None
+            if not 1 <= choice_num <= len(models):
+                raise ValueError(f"Model choice must be between 1 and {len(models)}, got {choice_num}")
+            selected.append(models[choice_num - 1])
+
+        print(CLIFormatter.success(f"Selected: {', '.join(m.name for m in selected)}"))
+        return selected
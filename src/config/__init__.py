@@ -4,6 +4,7 @@ Configuration for Windguru CLI.
 from .constants import (
     DEFAULT_HEADERS,
     OUTPUT_DIR,
+    WEATHER_MODEL_OBJECTS,
     WEATHER_MODELS,
     WINDGURU_API_URL,
     WINDGURU_BASE_URL,
@@ -14,6 +15,7 @@ __all__ = [
     'WINDGURU_BASE_URL',
     'WINDGURU_API_URL',
     'WEATHER_MODELS',
+    'WEATHER_MODEL_OBJECTS',
     'DEFAULT_HEADERS',
     'OUTPUT_DIR',
     'Settings',
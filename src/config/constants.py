@@ -2,6 +2,9 @@
 Constants used throughout the application.
 """
 from pathlib import Path
+from typing import Any
+
+from ..models.weather import WeatherModel
 
 # API URLs
 WINDGURU_BASE_URL = 'https://www.windguru.cz'
@@ -15,13 +18,15 @@ DEFAULT_HEADERS = {
 }
 
 # Weather Models
-WEATHER_MODELS = [
+WEATHER_MODELS: list[dict[str, Any]] = [
     {'id': 3, 'name': 'GFS 13 km (World)', 'resolution': '13km', 'coverage': 'World'},
     {'id': 117, 'name': 'IFS-HRES 9 km (World)', 'resolution': '9km', 'coverage': 'World'},
     {'id': 21, 'name': 'WRF 9 km (Europe)', 'resolution': '9km', 'coverage': 'Europe'},
     {'id': 43, 'name': 'ICON 7 km (Europe)', 'resolution': '7km', 'coverage': 'Europe'},
     {'id': 45, 'name': 'ICON 13 km (World)', 'resolution': '13km', 'coverage': 'World'},
 ]
+# Shared by every prompt and the TUI; WeatherModel is frozen, so this is safe
+WEATHER_MODEL_OBJECTS = tuple(WeatherModel(**m) for m in WEATHER_MODELS)
 
 # Output
 OUTPUT_DIR = Path('output')
@@ -32,9 +37,11 @@ DEFAULT_STEP_HOURS = 2
 MIN_USE_HR = 6
 
 # Visualization
-WIND_SPEED_ZONES = [
+WIND_SPEED_ZONES: list[dict[str, Any]] = [
     {'min': 0, 'max': 10, 'color': 'gray', 'label': 'Light'},
     {'min': 10, 'max': 20, 'color': 'green', 'label': 'Moderate'},
     {'min': 20, 'max': 30, 'color': 'yellow', 'label': 'Strong'},
     {'min': 30, 'max': 100, 'color': 'red', 'label': 'Very Strong'},
 ]
+# Longer series are downsampled (LTTB) before being embedded in the dashboard
+MAX_TRACE_POINTS = 2000
@@ -1,25 +1,44 @@
 """
 Application settings.
 """
+import functools
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Optional
 
+from ..models._compat import SLOTS
 
-@dataclass
+
+@dataclass(frozen=True, **SLOTS)
 class Settings:
     """Application settings."""
     output_dir: Path = Path('output')
     default_model_id: int = 3  # GFS 13km
     step_hours: int = 2
     timeout_seconds: int = 30
+    cache_dir: Optional[Path] = None  # Defaults to output_dir / '.cache'
+    cache_ttl_seconds: int = 7 * 86400  # Archive data for past dates doesn't change
+    write_gzip: bool = False  # Also write <name>.html.gz next to each dashboard
     verbose: bool = False
 
+    # Output directories already created in this process
+    _created: ClassVar[set[Path]] = set()
+
     def __post_init__(self) -> None:
         """Ensure output directory exists."""
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if self.output_dir not in Settings._created:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            Settings._created.add(self.output_dir)
+
+    @property
+    def cache_path(self) -> Path:
+        """Directory holding cached archive data."""
+        if self.cache_dir is not None:
+            return self.cache_dir
+        return self.output_dir / '.cache'
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def load(cls, config_file: Optional[Path] = None) -> 'Settings':
         """Load settings from file or use defaults."""
         # For now, just return defaults
@@ -0,0 +1,7 @@
+"""
+Python version compatibility helpers for the data models.
+"""
+import sys
+
+# Keyword arguments for @dataclass: use __slots__ where supported (Python 3.10+)
+SLOTS: dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
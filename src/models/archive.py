@@ -1,19 +1,21 @@
 """
 Archive request/response models.
 """
-from dataclasses import dataclass
+from collections.abc import Generator
+from dataclasses import dataclass, field
 from typing import Optional
 
+from ._compat import SLOTS
 from .weather import DateRange
 
 
-@dataclass
+@dataclass(frozen=True, **SLOTS)
 class ArchiveRequest:
     """Request parameters for archive data."""
     spot_id: int
     model_id: int
     date_range: DateRange
-    variables: list[str]
+    variables: tuple[str, ...]
     step_hours: int = 2
 
     @classmethod
@@ -21,7 +23,7 @@ class ArchiveRequest:
                include_wind: bool = True, include_temp: bool = True,
                include_gusts: bool = False) -> 'ArchiveRequest':
         """Create archive request with common parameters."""
-        variables = []
+        variables: list[str] = []
         if include_wind:
             variables.extend(['WINDSPD', 'WINDDIR'])
         if include_temp:
@@ -33,18 +35,27 @@ class ArchiveRequest:
             spot_id=spot_id,
             model_id=model_id,
             date_range=date_range,
-            variables=variables
+            variables=tuple(variables)
         )
 
 
-@dataclass
+@dataclass(**SLOTS)
 class ArchiveResponse:
     """Response from archive API."""
     html_content: str
     success: bool
     error: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    not_modified: bool = False
+    # Streamed body chunks, consumed once by the parser (instead of html_content)
+    chunks: Optional[Generator[bytes, None, None]] = field(
+        default=None, repr=False, compare=False
+    )
+    # Charset of the streamed chunks, when the server declares one
+    encoding: Optional[str] = None
 
     @property
     def has_data(self) -> bool:
         """Check if response contains data."""
-        return self.success and bool(self.html_content)
+        return self.success and (bool(self.html_content) or self.chunks is not None)
@@ -1,11 +1,13 @@
 """
 Authentication-related data models.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
+from ._compat import SLOTS
 
-@dataclass
+
+@dataclass(frozen=True, **SLOTS)
 class AuthCredentials:
     """Authentication credentials for Windguru."""
     idu: str
@@ -13,9 +15,10 @@ class AuthCredentials:
     session: Optional[str] = None
     deviceid: Optional[str] = None
     langc: str = 'en-'
+    _cookies: dict[str, str] = field(init=False, repr=False, compare=False)
 
-    def to_cookies(self) -> dict[str, str]:
-        """Convert credentials to cookies dictionary."""
+    def __post_init__(self) -> None:
+        """Build the cookies dict once; credentials are immutable."""
         cookies = {
             'idu': self.idu,
             'login_md5': self.login_md5,
@@ -25,7 +28,16 @@ class AuthCredentials:
             cookies['session'] = self.session
         if self.deviceid:
             cookies['deviceid'] = self.deviceid
-        return cookies
+        object.__setattr__(self, '_cookies', cookies)
+
+    @property
+    def cookies(self) -> dict[str, str]:
+        """Cookies dictionary sent with every authenticated request."""
+        return self._cookies
+
+    def to_cookies(self) -> dict[str, str]:
+        """Convert credentials to a new cookies dictionary."""
+        return dict(self._cookies)
 
     @classmethod
     def from_cookies(cls, cookies: dict[str, str]) -> 'AuthCredentials':
@@ -39,7 +51,7 @@ class AuthCredentials:
         )
 
 
-@dataclass
+@dataclass(**SLOTS)
 class LoginResponse:
     """Response from login API."""
     success: bool
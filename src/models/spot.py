@@ -4,8 +4,10 @@ Spot-related data models.
 from dataclasses import dataclass
 from typing import Optional
 
+from ._compat import SLOTS
 
-@dataclass
+
+@dataclass(frozen=True, **SLOTS)
 class Spot:
     """Represents a Windguru spot."""
     id: int
@@ -22,7 +24,7 @@ class Spot:
         return f"{self.name} (ID: {self.id})"
 
 
-@dataclass
+@dataclass(**SLOTS)
 class SpotSearchResult:
     """Result from spot search."""
     spots: list[Spot]
@@ -1,14 +1,89 @@
 """
 Weather-related data models.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
-from typing import Optional
-
-import pandas as pd
-
-
-@dataclass
+from typing import TYPE_CHECKING, Optional
+
+from ._compat import SLOTS
+
+if TYPE_CHECKING:
+    # Only needed for annotations; importing numpy or pandas here would pull
+    # them in for every consumer of the config constants (see
+    # WEATHER_MODEL_OBJECTS), so the statistics import numpy where they run
+    import numpy as np
+    import pandas as pd
+
+# Wind speed range boundaries (knots) and the reported ranges as
+# (label, lower edge index, upper edge index) into [-inf, *edges, +inf]
+_WIND_RANGE_EDGES = (10.0, 15.0, 20.0, 25.0, 30.0)
+_WIND_RANGES = (
+    ('0-10_knots', 0, 1),
+    ('10-20_knots', 1, 3),
+    ('15-25_knots', 2, 4),
+    ('20-30_knots', 3, 5),
+    ('30+_knots', 5, 6),
+)
+
+
+def _summarize(values: 'np.ndarray') -> tuple[dict, 'np.ndarray']:
+    """
+    Compute mean/median/min/max/std from a single sort of the values.
+
+    Args:
+        values: Samples without missing values
+
+    Returns:
+        Tuple of (summary stats, sorted values)
+    """
+    import numpy as np
+
+    ordered = np.sort(values)
+    total = len(ordered)
+    if total == 0:
+        nan = float('nan')
+        return {'mean': nan, 'median': nan, 'min': nan, 'max': nan, 'std': nan}, ordered
+
+    # The values are already sorted, so the median is just the middle element(s)
+    middle = total // 2
+    median = ordered[middle] if total % 2 else ordered[middle - 1:middle + 1].mean()
+
+    summary = {
+        'mean': ordered.mean(),
+        'median': median,
+        'min': ordered[0],
+        'max': ordered[-1],
+        'std': ordered.std(ddof=1) if total > 1 else float('nan'),
+    }
+    return summary, ordered
+
+
+def _wind_ranges(ordered: 'np.ndarray') -> dict:
+    """
+    Compute the share of samples in each wind speed range.
+
+    Every range boundary is located with a single searchsorted call on the
+    sorted samples instead of building one boolean mask per range.
+
+    Args:
+        ordered: Sorted, non-empty wind speeds
+
+    Returns:
+        Percentage of samples per range label
+    """
+    import numpy as np
+
+    total = len(ordered)
+
+    # Number of values below each boundary (ranges are left-closed)
+    below = np.concatenate(([0], np.searchsorted(ordered, _WIND_RANGE_EDGES), [total]))
+    return {
+        label: (below[high] - below[low]) / total * 100
+        for label, low, high in _WIND_RANGES
+    }
+
+
+@dataclass(frozen=True, **SLOTS)
 class WeatherModel:
     """Represents a weather forecast model."""
     id: int
@@ -21,16 +96,19 @@ class WeatherModel:
         return self.name
 
 
-@dataclass
+@dataclass(frozen=True, **SLOTS)
 class DateRange:
     """Represents a date range."""
     start: date
     end: date
+    _days: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Validate date range."""
-        if self.end < self.start:
+        """Validate date range and precompute its length."""
+        days = (self.end - self.start).days + 1
+        if days < 1:
             raise ValueError("End date must be after start date")
+        object.__setattr__(self, '_days', days)
 
     def __str__(self) -> str:
         """Return string representation."""
@@ -38,19 +116,21 @@ class DateRange:
 
     @property
     def days(self) -> int:
-        """Calculate number of days in range."""
-        return (self.end - self.start).days + 1
+        """Number of days in range (inclusive)."""
+        return self._days
 
 
-@dataclass
+@dataclass(frozen=True, **SLOTS)
 class WeatherData:
     """Container for parsed weather data."""
     spot_id: int
     model_id: int
     date_range: DateRange
-    dataframe: pd.DataFrame
+    dataframe: 'pd.DataFrame'
     spot_name: Optional[str] = None
     model_name: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
     @property
     def record_count(self) -> int:
@@ -72,39 +152,26 @@ class WeatherData:
         """Check if temperature data is present."""
         return 'temperature' in self.dataframe.columns
 
+    def _values(self, column: str) -> 'np.ndarray':
+        """Return a column as a float array with missing values dropped."""
+        import numpy as np
+
+        values = self.dataframe[column].to_numpy(dtype=np.float64)
+        return values[~np.isnan(values)]
+
     def get_summary_stats(self) -> dict:
         """Calculate summary statistics."""
         stats = {}
 
         if self.has_wind_speed:
-            wind_speed = self.dataframe['wind_speed'].dropna()
-            stats['wind_speed'] = {
-                'mean': wind_speed.mean(),
-                'median': wind_speed.median(),
-                'min': wind_speed.min(),
-                'max': wind_speed.max(),
-                'std': wind_speed.std()
-            }
+            summary, ordered = _summarize(self._values('wind_speed'))
+            stats['wind_speed'] = summary
 
             # Wind speed ranges
-            total = len(wind_speed)
-            if total > 0:
-                stats['wind_ranges'] = {
-                    '0-10_knots': len(wind_speed[wind_speed < 10]) / total * 100,
-                    '10-20_knots': len(wind_speed[(wind_speed >= 10) & (wind_speed < 20)]) / total * 100,
-                    '15-25_knots': len(wind_speed[(wind_speed >= 15) & (wind_speed < 25)]) / total * 100,
-                    '20-30_knots': len(wind_speed[(wind_speed >= 20) & (wind_speed < 30)]) / total * 100,
-                    '30+_knots': len(wind_speed[wind_speed >= 30]) / total * 100,
-                }
+            if len(ordered) > 0:
+                stats['wind_ranges'] = _wind_ranges(ordered)
 
         if self.has_temperature:
-            temp = self.dataframe['temperature'].dropna()
-            stats['temperature'] = {
-                'mean': temp.mean(),
-                'median': temp.median(),
-                'min': temp.min(),
-                'max': temp.max(),
-                'std': temp.std()
-            }
+            stats['temperature'], _ = _summarize(self._values('temperature'))
 
         return stats
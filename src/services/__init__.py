@@ -1,11 +1,22 @@
 """
 Service layer for Windguru CLI.
 """
-from .archive_service import ArchiveService
+from typing import TYPE_CHECKING, Any
+
 from .auth_service import AuthService
 from .credential_storage import CredentialStorage
 from .spot_service import SpotService
-from .visualization_service import VisualizationService
+from .weather_cache import WeatherCache
+
+if TYPE_CHECKING:
+    from .archive_service import ArchiveService
+    from .visualization_service import VisualizationService
+
+# Services imported on first access: they pull in pandas/lxml/plotly
+_LAZY_SERVICES = {
+    'ArchiveService': '.archive_service',
+    'VisualizationService': '.visualization_service',
+}
 
 __all__ = [
     'AuthService',
@@ -13,4 +24,14 @@ __all__ = [
     'ArchiveService',
     'VisualizationService',
     'CredentialStorage',
+    'WeatherCache',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the heavy services on first access."""
+    if name in _LAZY_SERVICES:
+        from importlib import import_module
+
+        return getattr(import_module(_LAZY_SERVICES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
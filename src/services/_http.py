@@ -0,0 +1,64 @@
+"""
+Shared HTTP session setup for Windguru services.
+"""
+import json
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..config.constants import DEFAULT_HEADERS
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the 'fast' extra
+    orjson = None  # type: ignore[assignment]
+
+
+def create_session() -> requests.Session:
+    """
+    Create a pooled session with retry/backoff for Windguru requests.
+
+    The default request headers are set on the session itself, so services
+    only pass per-request headers.
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504)
+        )
+    )
+    session.mount('https://', adapter)
+    return session
+
+
+def loads_json(content: bytes) -> Any:
+    """
+    Decode a JSON response body.
+
+    Uses orjson when it is installed (it parses the raw bytes directly) and
+    falls back to the standard library otherwise.
+
+    Args:
+        content: Raw response body
+
+    Returns:
+        Decoded JSON value
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+# Process-wide session used by every service unless one is passed in, so
+# login, spot search and archive fetches reuse the same keep-alive connection
+SESSION = create_session()
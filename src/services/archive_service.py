@@ -2,15 +2,19 @@
 Archive data fetching and parsing service.
 """
 import re
-from datetime import datetime
-from typing import Optional
+from collections import OrderedDict
+from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Any, Optional, Union
 
+import numpy as np
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 from ..config.constants import (
-    DEFAULT_HEADERS,
     MIN_USE_HR,
     WINDGURU_ARCHIVE_URL,
     WINDGURU_BASE_URL,
@@ -18,37 +22,243 @@ from ..config.constants import (
 from ..models.archive import ArchiveRequest, ArchiveResponse
 from ..models.auth import AuthCredentials
 from ..models.weather import WeatherData
+from ._http import SESSION
+
+# Number of recent get_weather_data results kept per service instance
+MEMO_MAXSIZE = 8
+
+# Wind direction arrows are SVG groups rotated by the bearing in degrees
+_ROTATE_RE = re.compile(r'rotate\((\d+)')
+
+# Charset parameter of a Content-Type header
+_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+# Cells of an archive row, compiled once instead of on every row.xpath() call
+_CELLS_XPATH = etree.XPath('./td')
+
+# Numeric columns by header label, checked in order; other headers hold arrows
+_NUMERIC_COLUMNS = (
+    ('Wind speed', 'wind_speed'),
+    ('Temperature', 'temperature'),
+    ('Wind gusts', 'wind_gust'),
+)
+
+# Result for archives without data rows: the time columns every parse produces,
+# with their final dtypes; measurement columns only exist when values were found
+_EMPTY_WEATHER_DF = pd.DataFrame({
+    'date': pd.Series(dtype='datetime64[s]'),
+    'hour': pd.Series(dtype=np.int8),
+    'datetime': pd.Series(dtype='datetime64[ns]'),
+})
+
+# Size of the response body chunks fed to the HTML parser while streaming
+STREAM_CHUNK_SIZE = 65536
+
+
+def _iter_body(response: requests.Response) -> Generator[bytes, None, None]:
+    """Yield a streamed response body, releasing the connection when done."""
+    try:
+        yield from response.iter_content(STREAM_CHUNK_SIZE)
+    finally:
+        response.close()
+
+
+def _declared_charset(response: requests.Response) -> Optional[str]:
+    """
+    Return the charset named in the Content-Type header, if any.
+
+    response.encoding falls back to ISO-8859-1 for text/html without a
+    charset, which would override the <meta charset> lxml detects itself.
+    """
+    match = _CHARSET_RE.search(response.headers.get('Content-Type', ''))
+    return match.group(1) if match else None
+
+
+def _iter_archive_rows(chunks: Iterable[Union[str, bytes]],
+                       encoding: Optional[str] = None) -> Iterator[Any]:
+    """
+    Incrementally parse archive HTML and yield the rows of its data table.
+
+    Each <tr> of the first "daily-archive" table is yielded as soon as its
+    closing tag has been parsed, so parsing overlaps with the download. Once
+    the caller moves on, the row and everything before it is freed, keeping
+    the in-memory tree to roughly one row.
+
+    Args:
+        chunks: HTML text or encoded body chunks
+        encoding: Charset of byte chunks (None lets lxml detect it)
+
+    Yields:
+        lxml <tr> elements of the archive table
+
+    Raises:
+        Exception: If the HTML contains no archive table
+    """
+    parser = None
+    table = None
+    rows_parent = None  # <table> or <tbody> directly holding the archive rows
+
+    def read_rows() -> Iterator[Any]:
+        nonlocal table, rows_parent
+        assert parser is not None
+        for _, row in parser.read_events():
+            # Rows sharing the known parent need no walk up the ancestors
+            parent = row.getparent()
+            if rows_parent is None or parent is not rows_parent:
+                owner = next(row.iterancestors('table'), None)
+                if owner is None or 'daily-archive' not in (owner.get('class') or '').split():
+                    continue
+                if table is None:
+                    table = owner
+                elif owner is not table:
+                    continue
+                rows_parent = parent
+
+            yield row
+
+            # Free the processed row and any earlier siblings
+            row.clear()
+            while row.getprevious() is not None:
+                del row.getparent()[0]
+
+    for chunk in chunks:
+        if parser is None:
+            parser = etree.HTMLPullParser(
+                events=('end',), tag='tr',
+                encoding=encoding if isinstance(chunk, bytes) else None
+            )
+            parser.set_element_class_lookup(lxml_html.HtmlElementClassLookup())
+        parser.feed(chunk)
+        yield from read_rows()
+
+    if parser is not None:
+        parser.close()
+        yield from read_rows()
+
+    if table is None:
+        raise Exception("Could not find archive data table in HTML")
+
+
+def _column_plan(variable_headers: list[tuple[str, int]]) -> list[tuple[str, int, bool]]:
+    """
+    Map each header variable to its target column and cell offset.
+
+    Args:
+        variable_headers: (header text, colspan) pairs in table order
+
+    Returns:
+        (column name, offset of its first cell after the date, is direction) tuples
+    """
+    plan = []
+    offset = 0
+    for header, colspan in variable_headers:
+        column = next((name for label, name in _NUMERIC_COLUMNS if label in header), None)
+        plan.append((column or 'wind_dir', offset, column is None))
+        offset += colspan
+    return plan
+
+
+def _cell_text(cell: Any) -> str:
+    """Return a cell's stripped text, reading .text directly for leaf cells."""
+    if len(cell):
+        return cell.text_content().strip()
+    return (cell.text or '').strip()
+
+
+def _parse_ddmmyyyy(text: str) -> date:
+    """
+    Parse a DD.MM.YYYY date without going through strptime's format parser.
+
+    Raises:
+        ValueError: If text is not a valid DD.MM.YYYY date
+    """
+    day, month, year = text.split('.')
+    return date(int(year), int(month), int(day))
+
+
+def _grown(array: np.ndarray, size: int, fill: Any = None) -> np.ndarray:
+    """Return a copy of array enlarged to size, new slots set to fill."""
+    out = np.empty(size, dtype=array.dtype) if fill is None else np.full(size, fill, dtype=array.dtype)
+    out[:len(array)] = array
+    return out
 
 
 class ArchiveService:
     """Handles fetching and parsing of archive data."""
 
-    def __init__(self, credentials: AuthCredentials) -> None:
+    def __init__(self, credentials: AuthCredentials,
+                 session: Optional[requests.Session] = None) -> None:
         """
         Initialize archive service.
 
         Args:
             credentials: Authentication credentials
+            session: HTTP session to use (defaults to the shared SESSION)
         """
         self.credentials = credentials
-        self.session = requests.Session()
+        self.session = session or SESSION
+        self._memo: OrderedDict[tuple, WeatherData] = OrderedDict()
+
+    @staticmethod
+    def _memo_key(request: ArchiveRequest) -> tuple:
+        """Build a hashable key identifying an archive request."""
+        return (
+            request.spot_id,
+            request.model_id,
+            request.date_range.start,
+            request.date_range.end,
+            tuple(sorted(request.variables)),
+            request.step_hours,
+        )
+
+    def prefetch_session(self, timeout: Optional[float] = None) -> bool:
+        """
+        Establish the archive page session ahead of a fetch.
 
-    def fetch(self, request: ArchiveRequest) -> ArchiveResponse:
+        Safe to run in a background thread while the user is still being
+        prompted; pass the result to fetch() as ``prefetched``.
+
+        Args:
+            timeout: Optional request timeout in seconds
+
+        Returns:
+            True if the session was established
+        """
+        try:
+            response = self.session.get(
+                f'{WINDGURU_BASE_URL}/archive.php',
+                cookies=self.credentials.cookies,
+                timeout=timeout
+            )
+            return response.status_code == 200
+        except Exception:
+            return False
+
+    def fetch(self, request: ArchiveRequest,
+              if_none_match: Optional[str] = None,
+              if_modified_since: Optional[str] = None,
+              prefetched: bool = False,
+              stream: bool = False) -> ArchiveResponse:
         """
         Fetch archive data from Windguru.
 
         Args:
             request: Archive request parameters
+            if_none_match: ETag of a previously fetched response
+            if_modified_since: Last-Modified value of a previously fetched response
+            prefetched: Skip establishing the session (already done by prefetch_session)
+            stream: Return the body as lazily downloaded chunks instead of html_content
 
         Returns:
-            ArchiveResponse with HTML content
+            ArchiveResponse with HTML content (empty with not_modified=True on HTTP 304)
         """
         try:
             # Establish session
-            self.session.get(
-                f'{WINDGURU_BASE_URL}/archive.php',
-                cookies=self.credentials.to_cookies()
-            )
+            if not prefetched:
+                self.session.get(
+                    f'{WINDGURU_BASE_URL}/archive.php',
+                    cookies=self.credentials.cookies
+                )
 
             # Build form data
             data = [
@@ -65,13 +275,33 @@ class ArchiveService:
             for var in request.variables:
                 data.append(('arch_params[]', var))
 
+            # Conditional request headers let the server skip an unchanged body
+            headers: dict[str, str] = {}
+            if if_none_match:
+                headers['If-None-Match'] = if_none_match
+            if if_modified_since:
+                headers['If-Modified-Since'] = if_modified_since
+
             response = self.session.post(
                 WINDGURU_ARCHIVE_URL,
                 data=data,
-                cookies=self.credentials.to_cookies(),
-                headers=DEFAULT_HEADERS
+                cookies=self.credentials.cookies,
+                headers=headers,
+                stream=stream
             )
 
+            if stream and response.status_code != 200:
+                response.close()
+
+            if response.status_code == 304:
+                return ArchiveResponse(
+                    html_content='',
+                    success=True,
+                    etag=response.headers.get('ETag', if_none_match),
+                    last_modified=response.headers.get('Last-Modified', if_modified_since),
+                    not_modified=True
+                )
+
             if response.status_code != 200:
                 return ArchiveResponse(
                     html_content='',
@@ -80,8 +310,12 @@ class ArchiveService:
                 )
 
             return ArchiveResponse(
-                html_content=response.text,
-                success=True
+                html_content='' if stream else response.text,
+                success=True,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'),
+                chunks=_iter_body(response) if stream else None,
+                encoding=_declared_charset(response) if stream else None
             )
 
         except Exception as e:
@@ -91,130 +325,222 @@ class ArchiveService:
                 error=str(e)
             )
 
+    def fetch_many(self, archive_requests: list[ArchiveRequest],
+                   max_workers: int = 8) -> list[ArchiveResponse]:
+        """
+        Fetch several archive requests concurrently over the shared session.
+
+        The archive session is established once up front, then the requests
+        are issued from a thread pool (keep max_workers within the session's
+        connection pool size).
+
+        Args:
+            archive_requests: Archive requests to fetch
+            max_workers: Maximum number of requests in flight
+
+        Returns:
+            ArchiveResponses in the same order as the requests
+        """
+        if not archive_requests:
+            return []
+
+        prefetched = self.prefetch_session()
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(archive_requests))) as executor:
+            return list(executor.map(
+                lambda request: self.fetch(request, prefetched=prefetched),
+                archive_requests
+            ))
+
     def parse(self, response: ArchiveResponse) -> pd.DataFrame:
         """
         Parse HTML archive data into DataFrame.
 
+        Streamed responses are parsed chunk by chunk as they download.
+
         Args:
-            response: Archive response with HTML content
+            response: Archive response with HTML content or body chunks
 
         Returns:
             pandas.DataFrame with parsed data
         """
         if not response.has_data:
-            return pd.DataFrame()
-
-        soup = BeautifulSoup(response.html_content, 'html.parser')
-
-        # Find the main forecast table
-        table = soup.find('table', class_='daily-archive')
-        if not table:
-            raise Exception("Could not find archive data table in HTML")
-
-        # Parse header to find which variables are present and their column spans
-        header_row = table.find_all('tr')[0]
-        variable_headers = []
-        for td in header_row.find_all('td'):
-            colspan_attr = td.get('colspan')
-            if colspan_attr:
-                colspan = int(str(colspan_attr))
-                text = td.get_text(strip=True)
-                variable_headers.append((text, colspan))
-
-        # Parse data rows
-        data_rows = []
-        for row in table.find_all('tr')[2:]:  # Skip first 2 header rows
-            cells = row.find_all('td')
-            if not cells:
-                continue
-
-            # First cell is the date
-            date_str = cells[0].get_text(strip=True)
-            try:
-                date = datetime.strptime(date_str, '%d.%m.%Y').date()
-            except ValueError:
-                continue
-
-            # Determine variable boundaries based on colspan
-            col_idx = 1  # Start after date column
-
-            # Extract data for each time point
-            num_time_points = variable_headers[0][1] if variable_headers else 12
-
-            for time_idx in range(num_time_points):
-                row_data = {'date': date, 'hour': time_idx * 2}
-
-                # Extract values for each variable at this time point
-                current_col = col_idx + time_idx
-                for var_name, colspan in variable_headers:
-                    cell = cells[current_col] if current_col < len(cells) else None
-
-                    if cell:
-                        # Check if it's wind direction (SVG arrow)
-                        svg = cell.find('svg')
-                        if svg:
-                            g = svg.find('g')
-                            transform_attr = g.get('transform') if g else None
+            return _EMPTY_WEATHER_DF.copy()
+
+        chunks: Iterable[Union[str, bytes]]
+        if response.chunks is not None:
+            chunks = response.chunks
+        else:
+            chunks = (response.html_content,)
+
+        variable_headers: list[tuple[str, int]] = []
+        col_plan: list[tuple[str, int, bool]] = []
+        num_time_points = 12
+        hour_pattern = np.arange(num_time_points, dtype=np.int8) * 2
+
+        # Column arrays grow geometrically as rows arrive
+        capacity = 0
+        dates = np.empty(0, dtype='datetime64[D]')
+        hours = np.empty(0, dtype=np.int8)
+        # float32 holds every reported value (whole degrees, tenths of knots/°C)
+        # at half the memory of float64
+        values = {
+            name: np.empty(0, dtype=np.float32)
+            for name in ('wind_speed', 'wind_dir', 'temperature', 'wind_gust')
+        }
+        seen: set[str] = set()
+        cursor = 0
+
+        try:
+            for row_idx, row in enumerate(_iter_archive_rows(chunks, response.encoding)):
+                if row_idx == 0:
+                    # Parse header to find which variables are present and their column spans
+                    for td in _CELLS_XPATH(row):
+                        colspan_attr = td.get('colspan')
+                        if colspan_attr:
+                            colspan = int(colspan_attr)
+                            text = td.text_content().strip()
+                            variable_headers.append((text, colspan))
+
+                    # Extract data for each time point
+                    if variable_headers:
+                        num_time_points = variable_headers[0][1]
+                        hour_pattern = np.arange(num_time_points, dtype=np.int8) * 2
+                    col_plan = _column_plan(variable_headers)
+                    continue
+
+                if row_idx == 1:
+                    continue  # Second header row
+
+                cells = _CELLS_XPATH(row)
+                if not cells:
+                    continue
+
+                # First cell is the date
+                date_str = _cell_text(cells[0])
+                try:
+                    row_date = _parse_ddmmyyyy(date_str)
+                except ValueError:
+                    continue
+
+                if cursor + num_time_points > capacity:
+                    capacity = max(2 * capacity, 64 * num_time_points)
+                    dates = _grown(dates, capacity)
+                    hours = _grown(hours, capacity)
+                    values = {
+                        name: _grown(column, capacity, np.nan) for name, column in values.items()
+                    }
+
+                dates[cursor:cursor + num_time_points] = row_date
+                hours[cursor:cursor + num_time_points] = hour_pattern
+
+                # Cells of each variable start right after the date column
+                n_cells = len(cells)
+                for name, offset, is_direction in col_plan:
+                    target = values[name]
+                    first_col = 1 + offset
+                    for time_idx in range(min(num_time_points, n_cells - first_col)):
+                        cell = cells[first_col + time_idx]
+
+                        if is_direction:
+                            # Wind direction is drawn as a rotated SVG arrow
+                            g = cell.find('.//svg//g')
+                            transform_attr = g.get('transform') if g is not None else None
                             if transform_attr:
-                                match = re.search(r'rotate\((\d+)', str(transform_attr))
+                                match = _ROTATE_RE.search(transform_attr)
                                 if match:
-                                    wind_dir = int(match.group(1)) % 360
-                                    row_data['wind_dir'] = wind_dir
+                                    target[cursor + time_idx] = int(match.group(1)) % 360
+                                    seen.add(name)
                         else:
                             # Extract numeric value
-                            text = cell.get_text(strip=True)
                             try:
-                                value = float(text)
-                                if 'Wind speed' in var_name:
-                                    row_data['wind_speed'] = value
-                                elif 'Temperature' in var_name:
-                                    row_data['temperature'] = value
-                                elif 'Wind gusts' in var_name:
-                                    row_data['wind_gust'] = value
+                                target[cursor + time_idx] = float(_cell_text(cell))
+                                seen.add(name)
                             except ValueError:
                                 pass
 
-                    # Move to next variable's columns
-                    current_col += colspan
-
-                data_rows.append(row_data)
-
-        # Convert to DataFrame
-        df = pd.DataFrame(data_rows)
-
-        # Create datetime column
-        if 'date' in df.columns and 'hour' in df.columns:
-            df['datetime'] = pd.to_datetime(
-                df['date'].astype(str) + ' ' + df['hour'].astype(str) + ':00:00'
-            )
+                cursor += num_time_points
+        finally:
+            # Release the connection even if parsing stopped early
+            if response.chunks is not None:
+                response.chunks.close()
+
+        if cursor == 0:
+            return _EMPTY_WEATHER_DF.copy()
+
+        # Convert to DataFrame; only variables that appeared become columns
+        columns: dict[str, np.ndarray] = {'date': dates[:cursor], 'hour': hours[:cursor]}
+        for name, column in values.items():
+            if name in seen:
+                column = column[:cursor]
+                if name == 'wind_dir' and not np.isnan(column).any():
+                    column = column.astype(np.int16)
+                columns[name] = column
+
+        # Create datetime column with datetime64 arithmetic (no Series round-trip)
+        columns['datetime'] = (
+            dates[:cursor].astype('datetime64[h]') + hours[:cursor]
+        ).astype('datetime64[ns]')
+
+        # The arrays are owned by this call, so let pandas wrap them as they
+        # are instead of copying them into consolidated blocks
+        df = pd.DataFrame(columns, copy=False)
 
         return df
 
     def get_weather_data(self, request: ArchiveRequest,
                          spot_name: Optional[str] = None,
-                         model_name: Optional[str] = None) -> WeatherData:
+                         model_name: Optional[str] = None,
+                         cached: Optional[WeatherData] = None,
+                         prefetched: bool = False) -> WeatherData:
         """
         Fetch and parse weather data in one call.
 
+        Results are memoized per instance, so repeating an identical request
+        within one session returns immediately without hitting the network.
+
         Args:
             request: Archive request parameters
             spot_name: Optional spot name for metadata
             model_name: Optional model name for metadata
+            cached: Previously fetched data; its ETag/Last-Modified are sent
+                as validators and it is returned as-is if the server replies 304
+            prefetched: Session was already established by prefetch_session
 
         Returns:
             WeatherData with parsed DataFrame
         """
-        response = self.fetch(request)
+        key = self._memo_key(request)
+        memoized = self._memo.get(key)
+        if memoized is not None:
+            self._memo.move_to_end(key)
+            return memoized
+
+        response = self.fetch(
+            request,
+            if_none_match=cached.etag if cached else None,
+            if_modified_since=cached.last_modified if cached else None,
+            prefetched=prefetched,
+            stream=True
+        )
         if not response.success:
             raise Exception(f"Failed to fetch archive data: {response.error}")
 
-        df = self.parse(response)
+        if response.not_modified and cached is not None:
+            weather_data = cached
+        else:
+            weather_data = WeatherData(
+                spot_id=request.spot_id,
+                model_id=request.model_id,
+                date_range=request.date_range,
+                dataframe=self.parse(response),
+                spot_name=spot_name,
+                model_name=model_name,
+                etag=response.etag,
+                last_modified=response.last_modified
+            )
 
-        return WeatherData(
-            spot_id=request.spot_id,
-            model_id=request.model_id,
-            date_range=request.date_range,
-            dataframe=df,
-            spot_name=spot_name,
-            model_name=model_name
-        )
+        self._memo[key] = weather_data
+        if len(self._memo) > MEMO_MAXSIZE:
+            self._memo.popitem(last=False)
+
+        return weather_data
@@ -1,19 +1,26 @@
 """
 Authentication service for Windguru API.
 """
+from typing import Optional
 
 import requests
 
-from ..config.constants import DEFAULT_HEADERS, WINDGURU_API_URL, WINDGURU_BASE_URL
+from ..config.constants import WINDGURU_API_URL, WINDGURU_BASE_URL
 from ..models.auth import AuthCredentials, LoginResponse
+from ._http import SESSION, loads_json
 
 
 class AuthService:
     """Handles authentication with Windguru."""
 
-    def __init__(self) -> None:
-        """Initialize authentication service."""
-        self.session = requests.Session()
+    def __init__(self, session: Optional[requests.Session] = None) -> None:
+        """
+        Initialize authentication service.
+
+        Args:
+            session: HTTP session to use (defaults to the shared SESSION)
+        """
+        self.session = session or SESSION
 
     def login(self, email: str, password: str) -> LoginResponse:
         """
@@ -39,8 +46,7 @@ class AuthService:
 
             response = self.session.get(
                 WINDGURU_API_URL,
-                params=params,
-                headers=DEFAULT_HEADERS
+                params=params
             )
 
             if response.status_code != 200:
@@ -50,7 +56,7 @@ class AuthService:
                     error=f"Login failed with HTTP {response.status_code}"
                 )
 
-            result = response.json()
+            result = loads_json(response.content)
 
             if result.get('return') != 'OK':
                 error_msg = result.get('message', 'Login failed')
@@ -62,19 +68,24 @@ class AuthService:
 
             # Extract credentials
             data = result.get('data', {})
+
+            # Pick up any session cookies
+            session_cookie = None
+            deviceid = None
+            for cookie in self.session.cookies:
+                if cookie.name == 'session':
+                    session_cookie = cookie.value
+                elif cookie.name == 'deviceid':
+                    deviceid = cookie.value
+
             credentials = AuthCredentials(
                 idu=str(data.get('id_user')),
                 login_md5=data.get('login_md5'),
+                session=session_cookie,
+                deviceid=deviceid,
                 langc='en-'
             )
 
-            # Add any session cookies
-            for cookie in self.session.cookies:
-                if cookie.name == 'session':
-                    credentials.session = cookie.value
-                elif cookie.name == 'deviceid':
-                    credentials.deviceid = cookie.value
-
             return LoginResponse(
                 success=True,
                 message="Login successful",
@@ -107,7 +118,7 @@ class AuthService:
         try:
             response = self.session.get(
                 f'{WINDGURU_BASE_URL}/archive.php',
-                cookies=credentials.to_cookies()
+                cookies=credentials.cookies
             )
             return response.status_code == 200
         except Exception:
@@ -16,6 +16,33 @@ class CredentialStorage:
     IDU_KEY = "idu"
     LOGIN_MD5_KEY = "login_md5"
 
+    # Values already read from (or written to) the keyring in this process;
+    # every keyring call is a round-trip to the OS credential store
+    _cache: dict[str, Optional[str]] = {}
+
+    @classmethod
+    def _get(cls, key: str) -> Optional[str]:
+        """
+        Read a keyring entry, reusing the value from earlier reads.
+
+        Args:
+            key: Keyring entry name
+
+        Returns:
+            Stored value, or None if missing
+
+        Raises:
+            Exception: If the keyring backend fails (the result is not cached)
+        """
+        if key not in cls._cache:
+            cls._cache[key] = keyring.get_password(cls.SERVICE_NAME, key)
+        return cls._cache[key]
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Forget cached keyring values so the next read hits the keyring."""
+        cls._cache.clear()
+
     @classmethod
     def save_username(cls, username: str) -> None:
         """
@@ -24,8 +51,10 @@ class CredentialStorage:
         Args:
             username: Email/username to save
         """
+        cls._cache.pop(cls.USERNAME_KEY, None)
         try:
             keyring.set_password(cls.SERVICE_NAME, cls.USERNAME_KEY, username)
+            cls._cache[cls.USERNAME_KEY] = username
         except Exception:
             # Silently fail if keyring is not available
             pass
@@ -39,7 +68,7 @@ class CredentialStorage:
             Username if found, None otherwise
         """
         try:
-            return keyring.get_password(cls.SERVICE_NAME, cls.USERNAME_KEY)
+            return cls._get(cls.USERNAME_KEY)
         except Exception:
             return None
 
@@ -52,9 +81,13 @@ class CredentialStorage:
             credentials: AuthCredentials to save
             username: Optional username to associate with credentials
         """
+        cls._cache.pop(cls.IDU_KEY, None)
+        cls._cache.pop(cls.LOGIN_MD5_KEY, None)
         try:
             keyring.set_password(cls.SERVICE_NAME, cls.IDU_KEY, credentials.idu)
+            cls._cache[cls.IDU_KEY] = credentials.idu
             keyring.set_password(cls.SERVICE_NAME, cls.LOGIN_MD5_KEY, credentials.login_md5)
+            cls._cache[cls.LOGIN_MD5_KEY] = credentials.login_md5
             if username:
                 cls.save_username(username)
         except Exception:
@@ -70,8 +103,8 @@ class CredentialStorage:
             AuthCredentials if found, None otherwise
         """
         try:
-            idu = keyring.get_password(cls.SERVICE_NAME, cls.IDU_KEY)
-            login_md5 = keyring.get_password(cls.SERVICE_NAME, cls.LOGIN_MD5_KEY)
+            idu = cls._get(cls.IDU_KEY)
+            login_md5 = cls._get(cls.LOGIN_MD5_KEY)
 
             if idu and login_md5:
                 return AuthCredentials(idu=idu, login_md5=login_md5)
@@ -82,6 +115,8 @@ class CredentialStorage:
     @classmethod
     def clear_credentials(cls) -> None:
         """Clear all saved credentials from keyring."""
+        cls.invalidate_cache()
+
         try:
             keyring.delete_password(cls.SERVICE_NAME, cls.USERNAME_KEY)
         except Exception:
@@ -105,4 +140,7 @@ class CredentialStorage:
         Returns:
             True if credentials exist, False otherwise
         """
-        return cls.get_credentials() is not None
+        try:
+            return bool(cls._get(cls.IDU_KEY) and cls._get(cls.LOGIN_MD5_KEY))
+        except Exception:
+            return False
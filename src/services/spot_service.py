@@ -1,28 +1,51 @@
 """
 Spot search service for Windguru API.
 """
-import json
 from typing import Optional
 
 import requests
 
-from ..config.constants import DEFAULT_HEADERS, WINDGURU_API_URL
+from ..config.constants import WINDGURU_API_URL
 from ..models.auth import AuthCredentials
 from ..models.spot import Spot, SpotSearchResult
+from ._http import SESSION, loads_json
+
+
+def _make_spot(suggestion: dict) -> Spot:
+    """
+    Build a Spot from one autocomplete suggestion.
+
+    Args:
+        suggestion: Suggestion dict with 'data' (spot ID) and 'value' (display name)
+
+    Returns:
+        Spot with the country taken from a "Country - SpotName" value
+    """
+    spot_id = suggestion.get('data')
+    spot_name = suggestion.get('value', '')
+    head, sep, _ = spot_name.partition(' - ')
+
+    return Spot(
+        id=int(spot_id) if spot_id else 0,
+        name=spot_name,
+        country=head if sep else None
+    )
 
 
 class SpotService:
     """Handles spot search operations."""
 
-    def __init__(self, credentials: AuthCredentials) -> None:
+    def __init__(self, credentials: AuthCredentials,
+                 session: Optional[requests.Session] = None) -> None:
         """
         Initialize spot service.
 
         Args:
             credentials: Authentication credentials
+            session: HTTP session to use (defaults to the shared SESSION)
         """
         self.credentials = credentials
-        self.session = requests.Session()
+        self.session = session or SESSION
 
     def search(self, query: str, limit: int = 10) -> SpotSearchResult:
         """
@@ -55,34 +78,16 @@ class SpotService:
             response = self.session.get(
                 WINDGURU_API_URL,
                 params=params,
-                cookies=self.credentials.to_cookies(),
-                headers=DEFAULT_HEADERS
+                cookies=self.credentials.cookies
             )
 
             if response.status_code != 200:
                 return SpotSearchResult(spots=[], query=query, total=0)
 
-            data = json.loads(response.text)
+            data = loads_json(response.content)
             suggestions = data.get('suggestions', [])
 
-            spots = []
-            for suggestion in suggestions[:limit]:
-                # Parse spot data
-                spot_id = suggestion.get('data')
-                spot_name = suggestion.get('value', '')
-
-                # Extract country from name if present (format: "Country - SpotName")
-                country = None
-                if ' - ' in spot_name:
-                    parts = spot_name.split(' - ', 1)
-                    country = parts[0]
-
-                spot = Spot(
-                    id=int(spot_id) if spot_id else 0,
-                    name=spot_name,
-                    country=country
-                )
-                spots.append(spot)
+            spots = [_make_spot(suggestion) for suggestion in suggestions[:limit]]
 
             return SpotSearchResult(
                 spots=spots,
@@ -1,28 +1,349 @@
 """
 Visualization service for creating charts and graphs.
 """
-from datetime import datetime
+import base64
+import gzip
+import hashlib
+import json
+import re
 from pathlib import Path
 from typing import Optional
 
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import numpy as np
+import pandas as pd
 
-from ..config.constants import WIND_SPEED_ZONES
+from ..config.constants import MAX_TRACE_POINTS, WIND_SPEED_ZONES
 from ..models.weather import WeatherData
+from ..utils.downsample_utils import bin_edges, lttb_indices, minmax_indices
+
+# Characters replaced with '_' in generated dashboard file names
+# (\W is everything but letters, digits and '_', matching str.isalnum())
+_UNSAFE_NAME_RE = re.compile(r'\W')
+
+# Part of every dashboard file name hash: bump it whenever the page template,
+# traces or _AVG_SCRIPT change, so files rendered by older code are not reused
+_RENDER_VERSION = 1
+
+# Passed as Plotly's post_script, which runs once the plot exists and fills
+# in {plot_id}; keeps the average annotations in sync with zoom/pan.
+# {series_data} is replaced with per-bin sums of the full series (see
+# _average_bins): the plotted traces are downsampled toward their extremes,
+# so averaging them would be biased
+_AVG_SCRIPT = """
+(function() {
+    var graphDiv = document.getElementById('{plot_id}');
+    var isUpdating = false;
+
+    // Little-endian typed arrays, base64 encoded
+    function decode(b64, ArrayType) {
+        var bin = atob(b64);
+        var bytes = new Uint8Array(bin.length);
+        for (var i = 0; i < bin.length; i++) {
+            bytes[i] = bin.charCodeAt(i);
+        }
+        return new ArrayType(bytes.buffer);
+    }
+
+    // Running totals with a leading 0, so any run of bins sums in two lookups
+    function runningTotals(values) {
+        var totals = new Float64Array(values.length + 1);
+        for (var i = 0; i < values.length; i++) {
+            totals[i + 1] = totals[i] + values[i];
+        }
+        return totals;
+    }
+
+    var series = {};
+    var encoded = {series_data};
+    var binTimes = decode(encoded.x, Float64Array);
+    for (var name in encoded.columns) {
+        series[name] = {
+            x: binTimes,
+            sum: runningTotals(decode(encoded.columns[name].sum, Float32Array)),
+            count: runningTotals(decode(encoded.columns[name].count, Float32Array))
+        };
+    }
+
+    // Axis range bound as epoch ms, reading the wall-clock fields as UTC
+    // like the embedded x values (Date parsing would apply the local zone)
+    var RANGE_DATE = /^(\\d+)-(\\d+)-(\\d+)(?:[ T](\\d+)(?::(\\d+)(?::(\\d+(?:\\.\\d+)?))?)?)?/;
+
+    function toMillis(value) {
+        if (typeof value === 'number') return value;
+        var m = RANGE_DATE.exec(String(value));
+        if (!m) return NaN;
+        var seconds = parseFloat(m[6] || '0');
+        return Date.UTC(+m[1], +m[2] - 1, +m[3], +(m[4] || 0), +(m[5] || 0), Math.floor(seconds)) +
+            Math.round((seconds % 1) * 1000);
+    }
+
+    // Index of the first value in the ascending array that is >= target
+    // (or > target when after is true)
+    function bisect(values, target, after) {
+        var lo = 0;
+        var hi = values.length;
+        while (lo < hi) {
+            var mid = (lo + hi) >>> 1;
+            if (values[mid] < target || (after && values[mid] === target)) {
+                lo = mid + 1;
+            } else {
+                hi = mid;
+            }
+        }
+        return lo;
+    }
+
+    // Mean of the bins overlapping the range (x holds each bin's first
+    // sample time plus an end bound), so it is off by at most one bin per edge
+    function calculateAverage(data, xaxis_range) {
+        var bins = data ? data.x.length - 1 : 0;
+        if (bins < 1) return null;
+
+        var lo = Math.max(0, bisect(data.x, toMillis(xaxis_range[0]), true) - 1);
+        var hi = Math.min(bisect(data.x, toMillis(xaxis_range[1]), true), bins);
+        var count = hi > lo ? data.count[hi] - data.count[lo] : 0;
+
+        return count > 0 ? (data.sum[hi] - data.sum[lo]) / count : null;
+    }
+
+    function updateAverages() {
+        if (!graphDiv || !graphDiv.layout || !graphDiv.data || isUpdating) return;
+
+        isUpdating = true;
+
+        try {
+            var xaxis1_range = graphDiv.layout.xaxis.range;
+            var xaxis2_range = graphDiv.layout.xaxis2.range;
+
+            // Get all existing annotations
+            var annotations = (graphDiv.layout.annotations || []).slice();
+
+            // Remove only the average annotations (keep wind zones and other annotations)
+            var filteredAnnotations = [];
+            for (var i = 0; i < annotations.length; i++) {
+                var ann = annotations[i];
+                // Keep annotation if it doesn't contain "Avg:" text
+                if (!ann.text || ann.text.indexOf('Avg:') === -1) {
+                    filteredAnnotations.push(ann);
+                }
+            }
+
+            // Calculate and add wind speed average
+            if (series.wind_speed && xaxis1_range) {
+                var windAvg = calculateAverage(series.wind_speed, xaxis1_range);
+                if (windAvg !== null) {
+                    filteredAnnotations.push({
+                        text: 'Avg: ' + windAvg.toFixed(1) + ' knots',
+                        xref: 'paper',
+                        yref: 'paper',
+                        x: 0.02,
+                        y: 0.98,
+                        xanchor: 'left',
+                        yanchor: 'top',
+                        showarrow: false,
+                        bgcolor: 'rgba(255, 255, 255, 0.9)',
+                        bordercolor: '#1f77b4',
+                        borderwidth: 2,
+                        borderpad: 4,
+                        font: {size: 14, color: '#1f77b4'}
+                    });
+                }
+            }
+
+            // Calculate and add temperature average
+            if (series.temperature && xaxis2_range) {
+                var tempAvg = calculateAverage(series.temperature, xaxis2_range);
+                if (tempAvg !== null) {
+                    filteredAnnotations.push({
+                        text: 'Avg: ' + tempAvg.toFixed(1) + '°C',
+                        xref: 'paper',
+                        yref: 'paper',
+                        x: 0.02,
+                        y: 0.36,
+                        xanchor: 'left',
+                        yanchor: 'top',
+                        showarrow: false,
+                        bgcolor: 'rgba(255, 255, 255, 0.9)',
+                        bordercolor: '#d62728',
+                        borderwidth: 2,
+                        borderpad: 4,
+                        font: {size: 14, color: '#d62728'}
+                    });
+                }
+            }
+
+            // Update the layout with all annotations
+            Plotly.relayout(graphDiv, {annotations: filteredAnnotations}).then(function() {
+                isUpdating = false;
+            }).catch(function(err) {
+                console.error('Error updating averages:', err);
+                isUpdating = false;
+            });
+        } catch(e) {
+            console.error('Error updating averages:', e);
+            isUpdating = false;
+        }
+    }
+
+    // Update on relayout events (zoom, pan, etc)
+    graphDiv.on('plotly_relayout', function(eventdata) {
+        // Skip if we're currently updating to avoid infinite loops
+        if (isUpdating) return;
+
+        // Check if this is a zoom/pan event (not triggered by our own relayout)
+        if (eventdata['xaxis.range[0]'] !== undefined ||
+            eventdata['xaxis2.range[0]'] !== undefined ||
+            eventdata['xaxis.autorange'] !== undefined ||
+            eventdata['xaxis2.autorange'] !== undefined) {
+            setTimeout(updateAverages, 100);
+        }
+    });
+})();
+"""
+
+
+def _downsample_for_display(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrink a long series once with min/max binning before building traces.
+
+    Keeps the extremes of every plotted column within 2 * MAX_TRACE_POINTS
+    bins, so the per-trace LTTB pass and the arrow sampling only see a
+    bounded number of rows.
+
+    Args:
+        df: Weather dataframe
+
+    Returns:
+        The dataframe itself if short enough, otherwise the selected rows
+    """
+    target = 2 * MAX_TRACE_POINTS
+    columns = [column for column in ('wind_speed', 'temperature') if column in df.columns]
+    if len(df) <= target or not columns:
+        return df
+
+    keep = np.unique(np.concatenate([
+        minmax_indices(df[column].to_numpy(), target) for column in columns
+    ]))
+    return df.iloc[keep]
+
+
+def _trace_points(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Get the x/y arrays to plot for a series, downsampled if it is long.
+
+    Args:
+        x: Datetime array shared by all traces
+        y: Values to plot
+
+    Returns:
+        Tuple of (datetimes, values) with at most MAX_TRACE_POINTS samples
+    """
+    keep = lttb_indices(x, y, MAX_TRACE_POINTS)
+    if len(keep) < len(y):
+        return x[keep], y[keep]
+    return x, y
+
+
+def _encode_array(values: np.ndarray, dtype: str) -> str:
+    """Base64 of the values as little-endian dtype bytes, decoded by _AVG_SCRIPT."""
+    return base64.b64encode(values.astype(dtype).tobytes()).decode('ascii')
+
+
+def _average_bins(df: pd.DataFrame, columns: list[str]) -> str:
+    """
+    Encode per-bin sums of the full series for in-browser range averages.
+
+    The series is split into the same MAX_TRACE_POINTS equal bins min/max
+    downsampling uses, so the page stays bounded however long the series
+    is. For each column the script gets the sum and count of the non-missing
+    values in every bin; a zoomed average is then exact up to the two bins
+    the range edges cut through.
+
+    Args:
+        df: Weather dataframe (not downsampled)
+        columns: Value columns to encode
+
+    Returns:
+        JSON object literal: base64 'x' bin start times (float64 epoch ms,
+        plus one past the last sample) and per-column float32 'sum'/'count'
+    """
+    total = len(df)
+    if not total:
+        return json.dumps({'x': '', 'columns': {}})
+
+    starts = bin_edges(total, min(total, MAX_TRACE_POINTS))[:-1]
+    x_ms = df['datetime'].to_numpy().astype('datetime64[ms]').astype(np.float64)
+    times = np.append(x_ms[starts], x_ms[-1] + 1)
+    encoded: dict = {'x': _encode_array(times, '<f8'), 'columns': {}}
+    for column in columns:
+        values = df[column].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(values)
+        sums = np.add.reduceat(np.where(valid, values, 0.0), starts)
+        counts = np.add.reduceat(valid, starts, dtype=np.int64)
+        encoded['columns'][column] = {
+            'sum': _encode_array(sums, '<f4'),
+            'count': _encode_array(counts, '<f4'),
+        }
+    return json.dumps(encoded)
+
+
+def _column_mean(df: pd.DataFrame, column: str) -> float:
+    """
+    Mean of a column computed on its raw float array, ignoring NaNs.
+
+    Args:
+        df: Weather dataframe
+        column: Value column
+
+    Returns:
+        Mean value, or NaN if the column has no values
+    """
+    values = df[column].to_numpy(dtype=np.float64)
+    values = values[~np.isnan(values)]
+    return float(values.mean()) if values.size else float('nan')
+
+
+def _axis_range(df: pd.DataFrame, column: str, pad: float = 0.05) -> Optional[list[float]]:
+    """
+    Initial y-axis range for a filled (tozeroy) trace, computed up front.
+
+    Args:
+        df: Weather dataframe
+        column: Value column shown on the axis
+        pad: Fraction of the span added beyond the data
+
+    Returns:
+        [low, high] including zero, or None to leave the axis on autorange
+    """
+    values = df[column].to_numpy(dtype=np.float64)
+    values = values[~np.isnan(values)]
+    if not values.size:
+        return None
+
+    low = min(0.0, float(values.min()))
+    high = max(0.0, float(values.max()))
+    span = (high - low) or 1.0
+    return [low - pad * span if low < 0 else low, high + pad * span]
 
 
 class VisualizationService:
     """Handles creation of visualizations."""
 
-    def __init__(self, output_dir: Path) -> None:
+    def __init__(self, output_dir: Path, enable_dynamic_averages: bool = True,
+                 write_gzip: bool = False) -> None:
         """
         Initialize visualization service.
 
         Args:
             output_dir: Directory to save visualizations
+            enable_dynamic_averages: Inject the script that recomputes the
+                average annotations on zoom/pan
+            write_gzip: Also write a pre-compressed <name>.html.gz next to
+                each dashboard, e.g. for serving from a static host
         """
         self.output_dir = output_dir
+        self.enable_dynamic_averages = enable_dynamic_averages
+        self.write_gzip = write_gzip
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
     def create_dashboard(self, weather_data: WeatherData,
@@ -38,8 +359,27 @@ class VisualizationService:
             Path to saved HTML file
         """
         df = weather_data.dataframe
+        display_df = _downsample_for_display(df)
+        # Shared by all traces and the arrows (a view, no Timestamp boxing)
+        x_arr = display_df['datetime'].to_numpy()
         spot_name = weather_data.spot_name or f"Spot {weather_data.spot_id}"
 
+        # Default file names carry a hash of everything that goes into the
+        # page, so re-rendering identical data returns the existing file
+        if not output_file:
+            safe_name = _UNSAFE_NAME_RE.sub('_', spot_name)
+            key = self._dashboard_key(weather_data, spot_name)
+            output_file = self.output_dir / f"{safe_name}_{key}_dashboard.html"
+            if output_file.exists() and (
+                not self.write_gzip or self._gzip_path(output_file).exists()
+            ):
+                return output_file
+
+        # Plotly is only needed for actual renders (its import is slow)
+        import plotly.graph_objects as go
+        import plotly.io as pio
+        from plotly.subplots import make_subplots
+
         # Create subplots
         fig = make_subplots(
             rows=2, cols=1,
@@ -53,10 +393,11 @@ class VisualizationService:
 
         # Wind Speed Plot with Direction Arrows
         if weather_data.has_wind_speed:
+            wind_x, wind_y = _trace_points(x_arr, display_df['wind_speed'].to_numpy())
             fig.add_trace(
-                go.Scatter(
-                    x=df['datetime'],
-                    y=df['wind_speed'],
+                go.Scattergl(
+                    x=wind_x,
+                    y=wind_y,
                     mode='lines',
                     name='Wind Speed',
                     line={"color": '#1f77b4', "width": 2},
@@ -67,52 +408,74 @@ class VisualizationService:
                 row=1, col=1
             )
 
-            # Add wind speed zones
-            for zone in WIND_SPEED_ZONES:
-                fig.add_hrect(
-                    y0=zone['min'], y1=zone['max'],
-                    line_width=0,
-                    fillcolor=zone['color'],
-                    opacity=0.1,
-                    annotation_text=zone['label'],
-                    annotation_position="right",
-                    row=1, col=1
-                )
+            # Add wind speed zones as shaded bands with a label on the right,
+            # the same layout objects add_hrect would create one call at a time
+            fig.layout.shapes += tuple(
+                {
+                    'type': 'rect',
+                    'xref': 'x domain',
+                    'yref': 'y',
+                    'x0': 0,
+                    'x1': 1,
+                    'y0': zone['min'],
+                    'y1': zone['max'],
+                    'fillcolor': zone['color'],
+                    'opacity': 0.1,
+                    'line': {'width': 0},
+                }
+                for zone in WIND_SPEED_ZONES
+            )
+            fig.layout.annotations += tuple(
+                {
+                    'text': zone['label'],
+                    'showarrow': False,
+                    'xref': 'x domain',
+                    'yref': 'y',
+                    'x': 1,
+                    'y': (zone['min'] + zone['max']) / 2,
+                    'xanchor': 'right',
+                    'yanchor': 'middle',
+                }
+                for zone in WIND_SPEED_ZONES
+            )
 
             # Add wind direction arrows (sample every Nth point to avoid clutter)
             if weather_data.has_wind_direction:
-                arrow_interval = max(1, len(df) // 30)  # Show ~30 arrows max
-                df_arrows = df.iloc[::arrow_interval]
-
-                for _, row in df_arrows.iterrows():
-                    # Convert wind direction to arrow angle (wind direction is "from", need to show "to")
-                    (row['wind_dir'] + 180) % 360 * 3.14159 / 180
-                    arrow_length = row['wind_speed'] * 0.3  # Scale arrow by wind speed
-
-                    fig.add_annotation(
-                        x=row['datetime'],
-                        y=row['wind_speed'],
-                        ax=0,
-                        ay=arrow_length,
-                        xref='x',
-                        yref='y',
-                        axref='pixel',
-                        ayref='pixel',
-                        showarrow=True,
-                        arrowhead=2,
-                        arrowsize=1,
-                        arrowwidth=2,
-                        arrowcolor='rgba(50, 50, 50, 0.6)',
-                        standoff=0,
-                        row=1, col=1
+                arrow_interval = max(1, len(display_df) // 30)  # Show ~30 arrows max
+                arrow_x = np.datetime_as_string(x_arr[::arrow_interval], unit='s')
+                arrow_y = display_df['wind_speed'].to_numpy()[::arrow_interval]
+                arrow_lengths = arrow_y * 0.3  # Scale arrow by wind speed
+
+                arrows = [
+                    {
+                        'x': x,
+                        'y': y,
+                        'ax': 0,
+                        'ay': arrow_length,
+                        'xref': 'x',
+                        'yref': 'y',
+                        'axref': 'pixel',
+                        'ayref': 'pixel',
+                        'showarrow': True,
+                        'arrowhead': 2,
+                        'arrowsize': 1,
+                        'arrowwidth': 2,
+                        'arrowcolor': 'rgba(50, 50, 50, 0.6)',
+                        'standoff': 0,
+                    }
+                    for x, y, arrow_length in zip(
+                        arrow_x.tolist(), arrow_y.tolist(), arrow_lengths.tolist()
                     )
+                ]
+                fig.layout.annotations += tuple(arrows)
 
         # Temperature Plot
         if weather_data.has_temperature:
+            temp_x, temp_y = _trace_points(x_arr, display_df['temperature'].to_numpy())
             fig.add_trace(
-                go.Scatter(
-                    x=df['datetime'],
-                    y=df['temperature'],
+                go.Scattergl(
+                    x=temp_x,
+                    y=temp_y,
                     mode='lines',
                     name='Temperature',
                     line={"color": '#d62728', "width": 2},
@@ -124,8 +487,8 @@ class VisualizationService:
             )
 
         # Calculate initial averages for the full dataset
-        wind_avg = df['wind_speed'].mean() if weather_data.has_wind_speed else None
-        temp_avg = df['temperature'].mean() if weather_data.has_temperature else None
+        wind_avg = _column_mean(df, 'wind_speed') if weather_data.has_wind_speed else None
+        temp_avg = _column_mean(df, 'temperature') if weather_data.has_temperature else None
 
         # Add initial average annotations
         if wind_avg is not None:
@@ -158,9 +521,12 @@ class VisualizationService:
                 name='temp_avg'
             )
 
-        # Update axes
-        fig.update_yaxes(title_text="Wind Speed (knots)", row=1, col=1)
-        fig.update_yaxes(title_text="Temperature (°C)", row=2, col=1)
+        # Update axes; explicit y ranges spare the browser an autorange scan
+        # over every point (double-click still resets to autorange)
+        wind_range = _axis_range(df, 'wind_speed') if weather_data.has_wind_speed else None
+        temp_range = _axis_range(df, 'temperature') if weather_data.has_temperature else None
+        fig.update_yaxes(title_text="Wind Speed (knots)", range=wind_range, row=1, col=1)
+        fig.update_yaxes(title_text="Temperature (°C)", range=temp_range, row=2, col=1)
         fig.update_xaxes(title_text="Date", row=2, col=1)
 
         # Update layout
@@ -173,188 +539,59 @@ class VisualizationService:
             modebar_add=['v1hovermode', 'toggleSpikeLines']
         )
 
-        # Add JavaScript for updating averages on zoom
-        avg_script = """
-        <script>
-        (function() {
-            function waitForPlotly() {
-                var graphDiv = document.getElementById('{plot_div_id}');
-                if (!graphDiv || !window.Plotly) {
-                    setTimeout(waitForPlotly, 100);
-                    return;
-                }
-
-                var isUpdating = false;
-
-                function calculateAverage(data, xaxis_range) {
-                    if (!data || !data.x || data.x.length === 0) return null;
-
-                    var x = data.x;
-                    var y = data.y;
-                    var sum = 0;
-                    var count = 0;
+        post_script = None
+        if self.enable_dynamic_averages:
+            columns = [
+                column for column, present in (
+                    ('wind_speed', weather_data.has_wind_speed),
+                    ('temperature', weather_data.has_temperature),
+                ) if present
+            ]
+            post_script = _AVG_SCRIPT.replace('{series_data}', _average_bins(df, columns))
+
+        # The figure is built entirely here, so skip Plotly's revalidation
+        html = pio.to_html(
+            fig,
+            include_plotlyjs='cdn',
+            full_html=True,
+            validate=False,
+            post_script=post_script
+        )
+        output_file.write_text(html, encoding='utf-8')
 
-                    for (var i = 0; i < x.length; i++) {
-                        var xval = new Date(x[i]).getTime();
-                        var x0 = new Date(xaxis_range[0]).getTime();
-                        var x1 = new Date(xaxis_range[1]).getTime();
+        if self.write_gzip:
+            with gzip.open(self._gzip_path(output_file), 'wt', encoding='utf-8',
+                           compresslevel=6) as f:
+                f.write(html)
 
-                        if (xval >= x0 && xval <= x1 && y[i] !== null && y[i] !== undefined && !isNaN(y[i])) {
-                            sum += y[i];
-                            count++;
-                        }
-                    }
+        return output_file
 
-                    return count > 0 ? sum / count : null;
-                }
+    def _dashboard_key(self, weather_data: WeatherData, spot_name: str) -> str:
+        """
+        Hash the inputs that determine a dashboard's content.
 
-                function updateAverages() {
-                    if (!graphDiv || !graphDiv.layout || !graphDiv.data || isUpdating) return;
-
-                    isUpdating = true;
-
-                    try {
-                        var xaxis1_range = graphDiv.layout.xaxis.range;
-                        var xaxis2_range = graphDiv.layout.xaxis2.range;
-
-                        // Get all existing annotations
-                        var annotations = (graphDiv.layout.annotations || []).slice();
-
-                        // Remove only the average annotations (keep wind zones and other annotations)
-                        var filteredAnnotations = [];
-                        for (var i = 0; i < annotations.length; i++) {
-                            var ann = annotations[i];
-                            // Keep annotation if it doesn't contain "Avg:" text
-                            if (!ann.text || ann.text.indexOf('Avg:') === -1) {
-                                filteredAnnotations.push(ann);
-                            }
-                        }
-
-                        // Calculate and add wind speed average
-                        if (graphDiv.data[0] && xaxis1_range) {
-                            var windAvg = calculateAverage(graphDiv.data[0], xaxis1_range);
-                            if (windAvg !== null) {
-                                filteredAnnotations.push({
-                                    text: 'Avg: ' + windAvg.toFixed(1) + ' knots',
-                                    xref: 'paper',
-                                    yref: 'paper',
-                                    x: 0.02,
-                                    y: 0.98,
-                                    xanchor: 'left',
-                                    yanchor: 'top',
-                                    showarrow: false,
-                                    bgcolor: 'rgba(255, 255, 255, 0.9)',
-                                    bordercolor: '#1f77b4',
-                                    borderwidth: 2,
-                                    borderpad: 4,
-                                    font: {size: 14, color: '#1f77b4'}
-                                });
-                            }
-                        }
-
-                        // Calculate and add temperature average
-                        for (var i = 0; i < graphDiv.data.length; i++) {
-                            if (graphDiv.data[i].name === 'Temperature' && xaxis2_range) {
-                                var tempAvg = calculateAverage(graphDiv.data[i], xaxis2_range);
-                                if (tempAvg !== null) {
-                                    filteredAnnotations.push({
-                                        text: 'Avg: ' + tempAvg.toFixed(1) + '°C',
-                                        xref: 'paper',
-                                        yref: 'paper',
-                                        x: 0.02,
-                                        y: 0.36,
-                                        xanchor: 'left',
-                                        yanchor: 'top',
-                                        showarrow: false,
-                                        bgcolor: 'rgba(255, 255, 255, 0.9)',
-                                        bordercolor: '#d62728',
-                                        borderwidth: 2,
-                                        borderpad: 4,
-                                        font: {size: 14, color: '#d62728'}
-                                    });
-                                }
-                                break;
-                            }
-                        }
-
-                        // Update the layout with all annotations
-                        Plotly.relayout(graphDiv, {annotations: filteredAnnotations}).then(function() {
-                            isUpdating = false;
-                        }).catch(function(err) {
-                            console.error('Error updating averages:', err);
-                            isUpdating = false;
-                        });
-                    } catch(e) {
-                        console.error('Error updating averages:', e);
-                        isUpdating = false;
-                    }
-                }
+        Covers the data and titles as well as the renderer version and the
+        output options, so a changed renderer never serves a stale file.
 
-                // Update on relayout events (zoom, pan, etc)
-                graphDiv.on('plotly_relayout', function(eventdata) {
-                    // Skip if we're currently updating to avoid infinite loops
-                    if (isUpdating) return;
-
-                    // Check if this is a zoom/pan event (not triggered by our own relayout)
-                    if (eventdata['xaxis.range[0]'] !== undefined ||
-                        eventdata['xaxis2.range[0]'] !== undefined ||
-                        eventdata['xaxis.autorange'] !== undefined ||
-                        eventdata['xaxis2.autorange'] !== undefined) {
-                        setTimeout(updateAverages, 100);
-                    }
-                });
-            }
+        Args:
+            weather_data: Weather data to visualize
+            spot_name: Display name used in the titles
 
-            if (document.readyState === 'loading') {
-                document.addEventListener('DOMContentLoaded', waitForPlotly);
-            } else {
-                waitForPlotly();
-            }
-        })();
-        </script>
+        Returns:
+            16-character hex digest
         """
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(
+            f"{_RENDER_VERSION}|{self.enable_dynamic_averages}|{self.write_gzip}|"
+            f"{spot_name}|{weather_data.date_range}|"
+            f"{','.join(map(str, weather_data.dataframe.columns))}".encode()
+        )
+        digest.update(
+            pd.util.hash_pandas_object(weather_data.dataframe, index=False).to_numpy().tobytes()
+        )
+        return digest.hexdigest()
 
-        # Save
-        if not output_file:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_name = "".join(c if c.isalnum() else '_' for c in spot_name)
-            output_file = self.output_dir / f"{safe_name}_{timestamp}_dashboard.html"
-
-        # Write HTML with include_plotlyjs='cdn' to reduce file size
-        fig.write_html(str(output_file), include_plotlyjs='cdn')
-
-        # Read the HTML file and inject the JavaScript
-        with open(output_file, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-
-        # Find the plot div ID - Plotly typically uses a specific pattern
-        import re
-        # Try multiple patterns to find the div
-        plot_div_match = re.search(r'<div id="([^"]+)"\s+class="plotly-graph-div"', html_content)
-        if not plot_div_match:
-            plot_div_match = re.search(r'<div id="([^"]+)"[^>]*class="plotly-graph-div"', html_content)
-        if not plot_div_match:
-            plot_div_match = re.search(r'<div[^>]+id="([^"]+)"[^>]*>', html_content)
-
-        if plot_div_match:
-            plot_div_id = plot_div_match.group(1)
-            print(f"Found plot div ID: {plot_div_id}")
-
-            # Inject the script before closing body tag
-            script_with_id = avg_script.replace('{plot_div_id}', plot_div_id)
-
-            if '</body>' in html_content:
-                html_content = html_content.replace('</body>', f'{script_with_id}</body>')
-                print("Injected JavaScript before </body> tag")
-            else:
-                # If no body tag, append at the end
-                html_content += script_with_id
-                print("Appended JavaScript at end of file")
-
-            # Write back the modified HTML
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-        else:
-            print("WARNING: Could not find plot div ID, JavaScript not injected")
-
-        return output_file
+    @staticmethod
+    def _gzip_path(output_file: Path) -> Path:
+        """Return the path of the compressed copy of a dashboard."""
+        return output_file.with_name(output_file.name + '.gz')
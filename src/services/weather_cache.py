@@ -0,0 +1,126 @@
+"""
+Disk-backed cache for fetched archive weather data.
+"""
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+from ..models.archive import ArchiveRequest
+from ..models.weather import WeatherData
+
+
+class WeatherCache:
+    """Stores parsed WeatherData on disk so repeated runs skip the network."""
+
+    def __init__(self, cache_dir: Path, ttl_seconds: int) -> None:
+        """
+        Initialize weather cache.
+
+        Args:
+            cache_dir: Directory holding cache entries
+            ttl_seconds: Maximum age of an entry before it is considered stale
+        """
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def key_for(request: ArchiveRequest) -> str:
+        """
+        Build the cache key for an archive request.
+
+        Args:
+            request: Archive request parameters
+
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = json.dumps({
+            'spot': request.spot_id,
+            'model': request.model_id,
+            'from': request.date_range.start.isoformat(),
+            'to': request.date_range.end.isoformat(),
+            'vars': list(request.variables),
+            'step': request.step_hours,
+        }, sort_keys=True)
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    def path_for(self, request: ArchiveRequest) -> Path:
+        """Return the cache file path for an archive request."""
+        return self.cache_dir / f"{self.key_for(request)}.pkl"
+
+    def is_fresh(self, request: ArchiveRequest) -> bool:
+        """
+        Check whether the cache entry for a request is younger than the TTL.
+
+        Args:
+            request: Archive request parameters
+
+        Returns:
+            True if an entry exists and has not expired
+        """
+        try:
+            age = time.time() - self.path_for(request).stat().st_mtime
+        except OSError:
+            return False
+        return age <= self.ttl_seconds
+
+    def load(self, request: ArchiveRequest) -> Optional[WeatherData]:
+        """
+        Load cached weather data regardless of its age.
+
+        Stale entries are still useful: their ETag/Last-Modified validators
+        allow a conditional request to revalidate them.
+
+        Args:
+            request: Archive request parameters
+
+        Returns:
+            Cached WeatherData, or None if missing or unreadable
+        """
+        try:
+            with open(self.path_for(request), 'rb') as f:
+                data = pickle.load(f)
+        except Exception:
+            return None
+
+        return data if isinstance(data, WeatherData) else None
+
+    def touch(self, request: ArchiveRequest) -> None:
+        """
+        Mark a cache entry as freshly validated.
+
+        Args:
+            request: Archive request parameters
+        """
+        try:
+            os.utime(self.path_for(request))
+        except OSError:
+            pass
+
+    def save(self, request: ArchiveRequest, weather_data: WeatherData) -> None:
+        """
+        Atomically write weather data to the cache.
+
+        Args:
+            request: Archive request parameters
+            weather_data: Weather data to store
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    # Newest protocol writes DataFrame columns as raw NumPy buffers
+                    pickle.dump(weather_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, self.path_for(request))
+            except Exception:
+                os.unlink(tmp_name)
+                raise
+        except Exception:
+            # Caching is best-effort; a failed write must not break the fetch
+            pass
@@ -1,27 +1,55 @@
 """
 Main Textual TUI application for Windguru Archive Browser.
 """
-import webbrowser
-from typing import Optional
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
 
+from textual import work
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal
 from textual.screen import Screen
+from textual.timer import Timer
+from textual.validation import Function
 from textual.widgets import Button, Footer, Header, Input, Label, Log, OptionList, Select
 from textual.widgets.option_list import Option
+from textual.worker import get_current_worker
 
-from ..config.constants import WEATHER_MODELS
+from ..config.constants import WEATHER_MODEL_OBJECTS
 from ..config.settings import Settings
 from ..models.auth import AuthCredentials
 from ..models.spot import Spot
-from ..models.weather import WeatherModel
-from ..services.archive_service import ArchiveService
+from ..models.weather import DateRange
+from ..services._http import create_session
 from ..services.auth_service import AuthService
 from ..services.credential_storage import CredentialStorage
 from ..services.spot_service import SpotService
-from ..services.visualization_service import VisualizationService
-from ..utils.date_utils import parse_date_range_input
-from ..utils.stats_utils import format_stats
+from ..utils.date_utils import parse_date_input, parse_date_range_input
+from ..utils.stats_utils import iter_stats
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime: these pull in pandas/lxml/plotly
+    from ..services.archive_service import ArchiveService
+    from ..services.visualization_service import VisualizationService
+
+# Number of distinct searches remembered by SpotSearchScreen
+SEARCH_CACHE_MAXSIZE = 32
+# Searches requested within this window collapse into one request
+SEARCH_DEBOUNCE_SECONDS = 0.25
+
+# Built once at import: model lookup for fetches and the Select options
+_WEATHER_MODELS_BY_ID = {model.id: model for model in WEATHER_MODEL_OBJECTS}
+_MODEL_OPTIONS = [(model.name, str(model.id)) for model in WEATHER_MODEL_OBJECTS]
+
+
+def _is_date_input(value: str) -> bool:
+    """Check a date field while typing (empty counts as not yet entered)."""
+    if not value.strip():
+        return True
+    try:
+        parse_date_input(value)
+    except ValueError:
+        return False
+    return True
 
 
 class LoginScreen(Screen):
@@ -137,6 +165,11 @@ class SpotSearchScreen(Screen):
         self.spot_service = spot_service
         self.spots: list[Spot] = []
         self.selected_indices: set[int] = set()
+        # Selection the option prompts currently show
+        self._last_rendered_selection: frozenset[int] = frozenset()
+        # Recent search results by normalized query, least recently used first
+        self._search_cache: OrderedDict[str, list[Spot]] = OrderedDict()
+        self._search_timer: Optional[Timer] = None
 
     def compose(self) -> ComposeResult:
         """Create UI components."""
@@ -152,6 +185,13 @@ class SpotSearchScreen(Screen):
                 Button("Back", id="back_btn"),
             )
 
+    def on_mount(self) -> None:
+        """Keep references to the widgets used by the event handlers."""
+        self._search_input = self.query_one("#search_input", Input)
+        self._option_list = self.query_one("#spot_list", OptionList)
+        self._select_btn = self.query_one("#select_btn", Button)
+        self._count_label = self.query_one("#selection_count", Label)
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         if event.button.id == "search_btn":
@@ -170,7 +210,7 @@ class SpotSearchScreen(Screen):
         """Handle key presses."""
         if event.key == "space":
             # Toggle selection on current highlighted item
-            option_list = self.query_one("#spot_list", OptionList)
+            option_list = self._option_list
             if option_list.highlighted is not None:
                 idx = option_list.highlighted
                 if idx in self.selected_indices:
@@ -178,38 +218,36 @@ class SpotSearchScreen(Screen):
                 else:
                     self.selected_indices.add(idx)
 
-                # Update the visual display
-                current_highlight = idx
                 self.update_selection_display()
 
-                # Restore highlight position
-                if current_highlight < len(self.spots):
-                    option_list.highlighted = current_highlight
-
                 event.prevent_default()
                 event.stop()
 
     def update_selection_display(self) -> None:
-        """Update the selection count display and button state."""
+        """Update the selection count display, button state and changed checkmarks."""
+        # Only rows whose selection changed since the last render need a new prompt
+        changed = self.selected_indices ^ self._last_rendered_selection
+        for idx in changed:
+            self._option_list.replace_option_prompt_at_index(idx, self._spot_prompt(idx))
+        self._last_rendered_selection = frozenset(self.selected_indices)
+
         count = len(self.selected_indices)
-        count_label = self.query_one("#selection_count", Label)
+        count_label = self._count_label
 
         if count == 0:
             count_label.update("Selected: None")
-            self.query_one("#select_btn", Button).disabled = True
+            self._select_btn.disabled = True
         elif count == 1:
             count_label.update("Selected: 1 spot")
-            self.query_one("#select_btn", Button).disabled = False
+            self._select_btn.disabled = False
         else:
             count_label.update(f"Selected: {count} spots")
-            self.query_one("#select_btn", Button).disabled = False
+            self._select_btn.disabled = False
 
-        # Update option list to show selected items with checkmark
-        option_list = self.query_one("#spot_list", OptionList)
-        option_list.clear_options()
-        for i, spot in enumerate(self.spots):
-            prefix = "✓ " if i in self.selected_indices else "  "
-            option_list.add_option(Option(f"{prefix}{spot}", id=str(i)))
+    def _spot_prompt(self, idx: int) -> str:
+        """Return the option label for a spot, with a checkmark if selected."""
+        prefix = "✓ " if idx in self.selected_indices else "  "
+        return f"{prefix}{self.spots[idx]}"
 
     def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
         """Handle option selection with Enter key - proceed with selected spots."""
@@ -225,35 +263,67 @@ class SpotSearchScreen(Screen):
         pass  # No action needed, just for navigation
 
     def search_spots(self) -> None:
+        """Schedule a spot search, coalescing rapid repeated requests."""
+        if self._search_timer is not None:
+            self._search_timer.stop()
+        self._search_timer = self.set_timer(SEARCH_DEBOUNCE_SECONDS, self._do_search)
+
+    def _do_search(self) -> None:
         """Search for spots."""
-        query = self.query_one("#search_input", Input).value
+        self._search_timer = None
+        query = self._search_input.value
         if not query:
             self.app.notify("Please enter a search term", severity="warning")
             return
 
-        self.app.notify(f"Searching for '{query}'...", severity="information")
-        result = self.spot_service.search(query)
+        spots = self._cached_search(query)
 
-        option_list = self.query_one("#spot_list", OptionList)
+        option_list = self._option_list
         option_list.clear_options()
+        self._last_rendered_selection = frozenset()
 
-        if not result.spots:
+        if not spots:
             self.app.notify("No spots found. Try a different search term.", severity="warning")
-            self.query_one("#select_btn", Button).disabled = True
+            self._select_btn.disabled = True
             return
 
-        self.spots = result.spots
+        self.spots = spots
         self.selected_indices.clear()
         self.app.notify(f"Found {len(self.spots)} spots!", severity="information")
 
-        # Add spots to option list
-        for i, spot in enumerate(self.spots):
-            option_list.add_option(Option(f"  {spot}", id=str(i)))
+        # Add spots to option list in one go (nothing is selected yet)
+        option_list.add_options(
+            Option(self._spot_prompt(i), id=str(i)) for i in range(len(self.spots))
+        )
 
         # Focus the option list for keyboard navigation
         option_list.focus()
         self.update_selection_display()
 
+    def _cached_search(self, query: str) -> list[Spot]:
+        """
+        Search for spots, reusing results of earlier identical searches.
+
+        Args:
+            query: Search term as entered
+
+        Returns:
+            Found spots (empty results are not cached, they may be errors)
+        """
+        key = query.strip().lower()
+        spots = self._search_cache.get(key)
+        if spots is not None:
+            self._search_cache.move_to_end(key)
+            return spots
+
+        self.app.notify(f"Searching for '{query}'...", severity="information")
+        spots = self.spot_service.search(query).spots
+        if spots:
+            self._search_cache[key] = spots
+            if len(self._search_cache) > SEARCH_CACHE_MAXSIZE:
+                self._search_cache.popitem(last=False)
+        return spots
+
     def select_spots(self) -> None:
         """Select the spots from selected_indices."""
         if not self.selected_indices:
@@ -307,9 +377,14 @@ class DataFetchScreen(Screen):
     DataFetchScreen Input {
         margin: 0 0 1 0;
     }
+
+    DataFetchScreen Input.-valid {
+        border: tall $success;
+    }
     """
 
-    def __init__(self, spot: Spot, archive_service: ArchiveService, viz_service: VisualizationService) -> None:
+    def __init__(self, spot: Spot, archive_service: "ArchiveService",
+                 viz_service: "VisualizationService") -> None:
         """Initialize data fetch screen."""
         super().__init__()
         self.spot = spot
@@ -322,12 +397,16 @@ class DataFetchScreen(Screen):
             yield Label(f"📊 Fetch Data for: {self.spot.name}", classes="title")
 
             yield Label("Weather Model:")
-            model_options = [(str(m['name']), str(m['id'])) for m in WEATHER_MODELS]  # type: ignore[typeddict-item]
-            yield Select(model_options, id="model_select", value="3")
+            yield Select(_MODEL_OPTIONS, id="model_select", value="3")
 
             yield Label("Date Range:")
-            yield Input(placeholder="From (e.g., 2024-05 or 2024-05-01)", id="date_from")
-            yield Input(placeholder="To (e.g., 2024-06 or 2024-06-10)", id="date_to")
+            # Inputs are validated as the user types (red/green border), so
+            # malformed dates show up before a fetch is attempted
+            date_validator = Function(_is_date_input, "Use YYYY-MM or YYYY-MM-DD")
+            yield Input(placeholder="From (e.g., 2024-05 or 2024-05-01)", id="date_from",
+                        validators=[date_validator])
+            yield Input(placeholder="To (e.g., 2024-06 or 2024-06-10)", id="date_to",
+                        validators=[date_validator])
 
             yield Horizontal(
                 Button("Fetch & Visualize", id="fetch_btn", variant="success"),
@@ -336,30 +415,38 @@ class DataFetchScreen(Screen):
 
             yield Log(id="log")
 
+    def on_mount(self) -> None:
+        """Keep references to the widgets used by the event handlers."""
+        self._log = self.query_one("#log", Log)
+        self._model_select = self.query_one("#model_select", Select)
+        self._date_from = self.query_one("#date_from", Input)
+        self._date_to = self.query_one("#date_to", Input)
+        self._fetch_btn = self.query_one("#fetch_btn", Button)
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         if event.button.id == "fetch_btn":
             self.fetch_data()
         elif event.button.id == "back_btn":
+            # Drop any fetch still running; its results are no longer wanted
+            self.workers.cancel_all()
             self.dismiss(False)
 
     def fetch_data(self) -> None:
-        """Fetch and visualize data."""
-        from ..models.archive import ArchiveRequest
-
-        log = self.query_one("#log", Log)
+        """Validate inputs and start fetching in a background worker."""
+        log = self._log
         log.clear()
 
         # Get inputs
-        model_value = self.query_one("#model_select", Select).value
+        model_value = self._model_select.value
         if isinstance(model_value, str):
             model_id = int(model_value)
         else:
             self.app.notify("Invalid model selection", severity="error")
             return
 
-        date_from = self.query_one("#date_from", Input).value
-        date_to = self.query_one("#date_to", Input).value
+        date_from = self._date_from.value
+        date_to = self._date_to.value
 
         if not date_from or not date_to:
             self.app.notify("Please enter both dates", severity="error")
@@ -367,31 +454,53 @@ class DataFetchScreen(Screen):
 
         try:
             # Parse date range
-            log.write_line("Parsing date range...")
             date_range = parse_date_range_input(date_from, date_to)
-            log.write_line(f"✅ Date range: {date_range}\n")
-
-            # Find model name
-            model = next(
-                (
-                    WeatherModel(
-                        id=m['id'],  # type: ignore[arg-type]
-                        name=m['name'],  # type: ignore[arg-type]
-                        resolution=m.get('resolution'),  # type: ignore[arg-type]
-                        coverage=m.get('coverage')  # type: ignore[arg-type]
-                    )
-                    for m in WEATHER_MODELS if m['id'] == model_id  # type: ignore[typeddict-item]
-                ),
-                None
-            )
-            model_name = model.name if model else f"Model {model_id}"
+        except ValueError as e:
+            log.write_line(f"\n❌ Error: {str(e)}")
+            self.app.notify(f"Error: {str(e)}", severity="error")
+            return
 
-            # Fetch data
-            log.write_line("📥 Fetching data from Windguru...")
-            log.write_line(f"   Spot: {self.spot.name}")
-            log.write_line(f"   Model: {model_name}")
-            log.write_line(f"   Dates: {date_range}\n")
+        # Find model name
+        model = _WEATHER_MODELS_BY_ID.get(model_id)
+        model_name = model.name if model else f"Model {model_id}"
+
+        self._write_log([
+            "Parsing date range...",
+            f"✅ Date range: {date_range}\n",
+            "📥 Fetching data from Windguru...",
+            f"   Spot: {self.spot.name}",
+            f"   Model: {model_name}",
+            f"   Dates: {date_range}\n",
+        ])
+
+        self._fetch_btn.disabled = True
+        self._do_fetch(model_id, model_name, date_range)
+
+    def _write_log(self, lines: list[str]) -> None:
+        """Write a step's log lines in one batch, so each step costs a single repaint."""
+        with self.app.batch_update():
+            self._log.write_lines(lines)
+
+    def _fetch_finished(self) -> None:
+        """Re-enable fetching once the worker is done."""
+        self._fetch_btn.disabled = False
+
+    @work(thread=True, exclusive=True)
+    def _do_fetch(self, model_id: int, model_name: str, date_range: DateRange) -> None:
+        """
+        Fetch, summarize and visualize data off the UI thread.
+
+        Args:
+            model_id: Weather model ID
+            model_name: Weather model display name
+            date_range: Date range to fetch
+        """
+        from ..models.archive import ArchiveRequest
 
+        worker = get_current_worker()
+        call = self.app.call_from_thread
+
+        try:
             request = ArchiveRequest.create(
                 spot_id=self.spot.id,
                 model_id=model_id,
@@ -405,30 +514,39 @@ class DataFetchScreen(Screen):
                 spot_name=self.spot.name,
                 model_name=model_name
             )
-
-            log.write_line(f"✅ Fetched {weather_data.record_count} data points!\n")
+            if worker.is_cancelled:
+                return
 
             # Display statistics
-            log.write_line("📊 Weather Statistics:")
             stats = weather_data.get_summary_stats()
-            stats_text = format_stats(stats)
-            for line in stats_text.split('\n'):
-                log.write_line(f"   {line}")
-
-            # Create visualization
-            log.write_line("\n📈 Creating interactive dashboard...")
+            call(self._write_log, [
+                f"✅ Fetched {weather_data.record_count} data points!\n",
+                "📊 Weather Statistics:",
+                *(f"   {line}" for line in iter_stats(stats)),
+                "\n📈 Creating interactive dashboard...",
+            ])
+
+            # Create visualization and open in browser
             dashboard_file = self.viz_service.create_dashboard(weather_data)
-            log.write_line(f"✅ Dashboard created: {dashboard_file.name}\n")
-
-            # Open in browser
-            webbrowser.open(f"file://{dashboard_file.absolute()}")
-            log.write_line("🌐 Opened dashboard in browser!")
+            if worker.is_cancelled:
+                return
 
-            self.app.notify("Success! Dashboard created and opened.", severity="information")
+            import webbrowser  # only needed once a dashboard exists
+            call(webbrowser.open, f"file://{dashboard_file.absolute()}")
+            call(self._write_log, [
+                f"✅ Dashboard created: {dashboard_file.name}\n",
+                "🌐 Opened dashboard in browser!",
+            ])
+            call(self.app.notify, "Success! Dashboard created and opened.", severity="information")
 
         except Exception as e:
-            log.write_line(f"\n❌ Error: {str(e)}")
-            self.app.notify(f"Error: {str(e)}", severity="error")
+            if not worker.is_cancelled:
+                call(self._write_log, [f"\n❌ Error: {str(e)}"])
+                call(self.app.notify, f"Error: {str(e)}", severity="error")
+
+        finally:
+            if not worker.is_cancelled:
+                call(self._fetch_finished)
 
 
 class WindguruTUI(App):
@@ -500,6 +618,8 @@ class WindguruTUI(App):
         self.spot_service: Optional[SpotService] = None
         self.archive_service: Optional[ArchiveService] = None
         self.viz_service: Optional[VisualizationService] = None
+        # Whether the keyring holds credentials; probed once, reset on changes
+        self._has_saved: Optional[bool] = None
 
     def compose(self) -> ComposeResult:
         """Create UI components."""
@@ -512,8 +632,9 @@ class WindguruTUI(App):
 
     def run_login(self) -> None:
         """Run login flow."""
-        has_saved = CredentialStorage.has_saved_credentials()
-        self.push_screen(LoginScreen(has_saved), self.handle_login)  # type: ignore[arg-type]
+        if self._has_saved is None:
+            self._has_saved = CredentialStorage.has_saved_credentials()
+        self.push_screen(LoginScreen(self._has_saved), self.handle_login)  # type: ignore[arg-type]
 
     def handle_login(self, result: Optional[tuple[str, Optional[str], Optional[str]]]) -> None:
         """Handle login result."""
@@ -532,13 +653,14 @@ class WindguruTUI(App):
                 return
 
             self.credentials = creds
-            self.auth_service = AuthService()
+            self.auth_service = AuthService(create_session())
 
             # Validate credentials
             self.notify("Validating credentials...", severity="information")
             if not self.auth_service.validate_credentials(self.credentials):
                 self.notify("Saved credentials are invalid! Clearing...", severity="error")
                 CredentialStorage.clear_credentials()
+                self._has_saved = False
                 self.run_login()
                 return
 
@@ -553,7 +675,7 @@ class WindguruTUI(App):
                 self.run_login()
                 return
 
-            self.auth_service = AuthService()
+            self.auth_service = AuthService(create_session())
             self.notify("Connecting to Windguru...", severity="information")
 
             response = self.auth_service.login(email, password)
@@ -569,6 +691,8 @@ class WindguruTUI(App):
 
             # Save credentials
             CredentialStorage.save_credentials(self.credentials, username=email)
+            # Saving fails silently without a keyring, so probe again next time
+            self._has_saved = None
             self.notify("Credentials saved!", severity="information")
 
             self.initialize_services()
@@ -580,9 +704,16 @@ class WindguruTUI(App):
             self.notify("No credentials available", severity="error")
             return
 
-        self.spot_service = SpotService(self.credentials)
-        self.archive_service = ArchiveService(self.credentials)
-        self.viz_service = VisualizationService(self.settings.output_dir)
+        from ..services.archive_service import ArchiveService
+        from ..services.visualization_service import VisualizationService
+
+        # Share the login's session, whose cookies belong to this user
+        session = self.auth_service.session if self.auth_service else None
+        self.spot_service = SpotService(self.credentials, session)
+        self.archive_service = ArchiveService(self.credentials, session)
+        self.viz_service = VisualizationService(
+            self.settings.output_dir, write_gzip=self.settings.write_gzip
+        )
 
     def run_spot_search(self) -> None:
         """Run spot search flow."""
@@ -1,15 +1,38 @@
 """
 Utility functions for Windguru CLI.
 """
+from typing import TYPE_CHECKING, Any
+
 from .date_utils import get_last_day_of_month, parse_date_input, parse_date_range_input
 from .file_utils import generate_safe_filename
-from .stats_utils import format_stats, print_weather_stats
+from .stats_utils import format_stats, iter_stats, print_weather_stats
+
+if TYPE_CHECKING:
+    from .downsample_utils import lttb_indices, minmax_indices
+
+# Helpers imported on first access: they pull in numpy
+_LAZY_UTILS = {
+    'lttb_indices': '.downsample_utils',
+    'minmax_indices': '.downsample_utils',
+}
 
 __all__ = [
     'parse_date_input',
     'parse_date_range_input',
     'get_last_day_of_month',
     'format_stats',
+    'iter_stats',
     'print_weather_stats',
     'generate_safe_filename',
+    'lttb_indices',
+    'minmax_indices',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the numpy-backed helpers on first access."""
+    if name in _LAZY_UTILS:
+        from importlib import import_module
+
+        return getattr(import_module(_LAZY_UTILS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,16 @@
 """
 Date parsing and manipulation utilities.
 """
-from datetime import date, datetime
-
-from dateutil.relativedelta import relativedelta
+import calendar
+import functools
+import re
+from datetime import date
 
 from ..models.weather import DateRange
 
+# YYYY-MM or YYYY-MM-DD
+_DATE_RE = re.compile(r'([0-9]{4})-([0-9]{2})(?:-([0-9]{2}))?')
+
 
 def parse_date_input(date_str: str) -> date:
     """
@@ -23,26 +27,21 @@ def parse_date_input(date_str: str) -> date:
     """
     date_str = date_str.strip()
 
-    # Try YYYY-MM format first
-    if len(date_str) == 7:
-        try:
-            return datetime.strptime(date_str + '-01', '%Y-%m-%d').date()
-        except ValueError:
-            pass
-
-    # Try YYYY-MM-DD format
-    if len(date_str) == 10:
+    match = _DATE_RE.fullmatch(date_str)
+    if match:
+        year, month, day = match.groups()
         try:
-            return datetime.strptime(date_str, '%Y-%m-%d').date()
+            return date(int(year), int(month), int(day) if day else 1)
         except ValueError:
             pass
 
     raise ValueError(f"Invalid date format: {date_str}. Use YYYY-MM or YYYY-MM-DD")
 
 
+@functools.lru_cache(maxsize=4096)
 def get_last_day_of_month(year: int, month: int) -> date:
     """
-    Get the last day of a given month.
+    Get the last day of a given month (cached; dates are immutable).
 
     Args:
         year: Year
@@ -51,14 +50,7 @@ def get_last_day_of_month(year: int, month: int) -> date:
     Returns:
         Last day of the month
     """
-    # Get first day of next month and subtract one day
-    if month == 12:
-        next_month = datetime(year + 1, 1, 1)
-    else:
-        next_month = datetime(year, month + 1, 1)
-
-    last_day = next_month - relativedelta(days=1)
-    return last_day.date()
+    return date(year, month, calendar.monthrange(year, month)[1])
 
 
 def parse_date_range_input(from_str: str, to_str: str) -> DateRange:
@@ -0,0 +1,103 @@
+"""
+Time series downsampling utilities for plotting.
+"""
+import numpy as np
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select the points to keep with Largest-Triangle-Three-Buckets (LTTB).
+
+    The first and last samples are always kept; every bucket in between
+    contributes the point forming the largest triangle with the previously
+    kept point and the mean of the next bucket, which preserves peaks and
+    troughs far better than taking every Nth sample.
+
+    Args:
+        x: Sample positions (numeric or datetime64), ascending
+        y: Sample values
+        n_out: Number of points to keep
+
+    Returns:
+        Sorted indices of the kept samples (all indices if no reduction is needed)
+    """
+    total = len(y)
+    if n_out >= total or n_out < 3:
+        return np.arange(total)
+
+    xs = np.asarray(x)
+    if np.issubdtype(xs.dtype, np.datetime64):
+        xs = xs.astype('datetime64[ns]').view(np.int64)
+    xs = xs.astype(np.float64)
+    ys = np.asarray(y, dtype=np.float64)
+
+    # n_out - 2 buckets between the fixed first and last sample
+    edges = np.linspace(1, total - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = total - 1
+
+    anchor = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else total
+        avg_x = xs[end:next_end].mean()
+        avg_y = ys[end:next_end].mean()
+
+        area = np.abs(
+            (xs[anchor] - avg_x) * (ys[start:end] - ys[anchor])
+            - (xs[anchor] - xs[start:end]) * (avg_y - ys[anchor])
+        )
+        anchor = start + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        selected[i + 1] = anchor
+
+    return selected
+
+
+def bin_edges(total: int, bins: int) -> np.ndarray:
+    """
+    Split total samples into bins of (nearly) equal length.
+
+    Args:
+        total: Number of samples
+        bins: Number of bins (at most total, so no bin is empty)
+
+    Returns:
+        bins + 1 ascending indices; bin i covers [edges[i], edges[i + 1])
+    """
+    return np.linspace(0, total, bins + 1).astype(np.int64)
+
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select the minimum and maximum sample of each of n_out // 2 equal bins.
+
+    A single cheap pass that keeps every spike and dip; used to shrink long
+    series before the more expensive LTTB step.
+
+    Args:
+        y: Sample values
+        n_out: Upper bound on the number of points to keep
+
+    Returns:
+        Sorted, unique indices of the kept samples (all indices if no
+        reduction is needed)
+    """
+    total = len(y)
+    bins = n_out // 2
+    if n_out >= total or bins < 1:
+        return np.arange(total)
+
+    ys = np.asarray(y, dtype=np.float64)
+    # Missing values never win a bin unless it has nothing else
+    low = np.where(np.isnan(ys), np.inf, ys)
+    high = np.where(np.isnan(ys), -np.inf, ys)
+
+    edges = bin_edges(total, bins)
+    selected = np.empty(2 * bins, dtype=np.int64)
+    for i in range(bins):
+        start, end = edges[i], edges[i + 1]
+        selected[2 * i] = start + int(np.argmin(low[start:end]))
+        selected[2 * i + 1] = start + int(np.argmax(high[start:end]))
+
+    return np.unique(selected)
@@ -5,6 +5,12 @@ import re
 from datetime import datetime
 from pathlib import Path
 
+# Characters dropped from spot names, and separator runs collapsed to '_'
+_UNSAFE_CHARS = re.compile(r'[^\w\s-]')
+_SEP_RUN = re.compile(r'[-\s]+')
+# The same deletion for ASCII names, as a str.translate table
+_ASCII_UNSAFE = {c: None for c in range(128) if _UNSAFE_CHARS.match(chr(c))}
+
 
 def generate_safe_filename(spot_name: str, suffix: str = "", extension: str = "html") -> str:
     """
@@ -18,12 +24,19 @@ def generate_safe_filename(spot_name: str, suffix: str = "", extension: str = "h
     Returns:
         Safe filename with timestamp
     """
-    # Remove unsafe characters
-    safe_name = re.sub(r'[^\w\s-]', '', spot_name)
-    safe_name = re.sub(r'[-\s]+', '_', safe_name)
-
-    # Add timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Remove unsafe characters (translate is cheaper but ASCII-only)
+    if spot_name.isascii():
+        cleaned = spot_name.translate(_ASCII_UNSAFE)
+    else:
+        cleaned = _UNSAFE_CHARS.sub('', spot_name)
+    safe_name = _SEP_RUN.sub('_', cleaned)
+
+    # Add timestamp (YYYYmmdd_HHMMSS)
+    now = datetime.now()
+    timestamp = (
+        f"{now.year:04d}{now.month:02d}{now.day:02d}_"
+        f"{now.hour:02d}{now.minute:02d}{now.second:02d}"
+    )
 
     # Build filename
     parts = [safe_name, timestamp]
@@ -1,49 +1,64 @@
 """
 Statistics formatting and display utilities.
 """
+import sys
+from collections.abc import Iterator
 from typing import Any
 
 from ..models.weather import WeatherData
 
+# Shared layout of the wind speed and temperature sections, one format per line
+_STAT_LINES = (
+    "{title}",
+    "  Mean:    {mean:.1f}",
+    "  Median:  {median:.1f}",
+    "  Min:     {min:.1f}",
+    "  Max:     {max:.1f}",
+)
 
-def format_stats(stats: dict[str, Any]) -> str:
+
+def iter_stats(stats: dict[str, Any]) -> Iterator[str]:
     """
-    Format statistics dictionary into readable string.
+    Yield the formatted statistics one line at a time.
+
+    Sections are followed by an empty line, except the last one, so callers
+    can indent or write each line directly.
 
     Args:
         stats: Statistics dictionary from WeatherData.get_summary_stats()
 
-    Returns:
-        Formatted string
+    Yields:
+        Formatted lines (without trailing newline)
     """
-    lines = []
-
     if 'wind_speed' in stats:
-        ws = stats['wind_speed']
-        lines.append("WIND SPEED (knots)")
-        lines.append(f"  Mean:    {ws['mean']:.1f}")
-        lines.append(f"  Median:  {ws['median']:.1f}")
-        lines.append(f"  Min:     {ws['min']:.1f}")
-        lines.append(f"  Max:     {ws['max']:.1f}")
-        lines.append("")
+        values = {**stats['wind_speed'], 'title': "WIND SPEED (knots)"}
+        yield from (line.format_map(values) for line in _STAT_LINES)
+        yield ""
 
     if 'wind_ranges' in stats:
         wr = stats['wind_ranges']
-        lines.append("FAVORABLE CONDITIONS (% of time)")
-        lines.append(f"  10-20 knots: {wr['10-20_knots']:.1f}%")
-        lines.append(f"  15-25 knots: {wr['15-25_knots']:.1f}%")
-        lines.append(f"  20-30 knots: {wr['20-30_knots']:.1f}%")
-        lines.append("")
+        yield "FAVORABLE CONDITIONS (% of time)"
+        yield f"  10-20 knots: {wr['10-20_knots']:.1f}%"
+        yield f"  15-25 knots: {wr['15-25_knots']:.1f}%"
+        yield f"  20-30 knots: {wr['20-30_knots']:.1f}%"
+        yield ""
 
     if 'temperature' in stats:
-        temp = stats['temperature']
-        lines.append("TEMPERATURE (°C)")
-        lines.append(f"  Mean:    {temp['mean']:.1f}")
-        lines.append(f"  Median:  {temp['median']:.1f}")
-        lines.append(f"  Min:     {temp['min']:.1f}")
-        lines.append(f"  Max:     {temp['max']:.1f}")
+        values = {**stats['temperature'], 'title': "TEMPERATURE (°C)"}
+        yield from (line.format_map(values) for line in _STAT_LINES)
+
+
+def format_stats(stats: dict[str, Any]) -> str:
+    """
+    Format statistics dictionary into readable string.
+
+    Args:
+        stats: Statistics dictionary from WeatherData.get_summary_stats()
 
-    return "\n".join(lines)
+    Returns:
+        Formatted string
+    """
+    return "\n".join(iter_stats(stats))
 
 
 def print_weather_stats(weather_data: WeatherData) -> None:
@@ -54,16 +69,19 @@ def print_weather_stats(weather_data: WeatherData) -> None:
         weather_data: Weather data to print stats for
     """
     spot_name = weather_data.spot_name or f"Spot {weather_data.spot_id}"
-
-    print("\n" + "=" * 60)
-    print(f"Wind Statistics for {spot_name}")
-    print("=" * 60)
-    print(f"Date Range: {weather_data.date_range}")
-    print(f"Total Records: {weather_data.record_count}")
-    print()
-    print("-" * 60)
-
     stats = weather_data.get_summary_stats()
-    print(format_stats(stats))
 
-    print("=" * 60)
+    # Build the whole report first so it goes out in a single write
+    report = [
+        "",
+        "=" * 60,
+        f"Wind Statistics for {spot_name}",
+        "=" * 60,
+        f"Date Range: {weather_data.date_range}",
+        f"Total Records: {weather_data.record_count}",
+        "",
+        "-" * 60,
+        format_stats(stats),
+        "=" * 60,
+    ]
+    sys.stdout.write("\n".join(report) + "\n")
@@ -0,0 +1,116 @@
+"""
+Shared test fixtures.
+"""
+from datetime import date
+from functools import partial
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.cli.app import WindguruCLI
+from src.models.auth import AuthCredentials, LoginResponse
+from src.models.spot import Spot
+from src.models.weather import DateRange
+from src.services.auth_service import AuthService
+from src.services.credential_storage import CredentialStorage
+
+
+@pytest.fixture(scope="session")
+def sample_creds():
+    """Credentials shared by every test (frozen, safe to reuse)."""
+    return AuthCredentials(idu="123", login_md5="abc")
+
+
+@pytest.fixture(scope="session")
+def session_creds():
+    """sample_creds plus a session cookie (frozen, safe to reuse)."""
+    return AuthCredentials(idu="123", login_md5="abc", session="xyz")
+
+
+@pytest.fixture(scope="session")
+def sample_spot():
+    """Spot shared by every test (frozen, safe to reuse)."""
+    return Spot(id=123, name="Test Beach", country="Greece")
+
+
+@pytest.fixture(scope="session")
+def jan_2024_range():
+    """January 2024 (frozen, safe to reuse)."""
+    return DateRange(date(2024, 1, 1), date(2024, 1, 31))
+
+
+@pytest.fixture(scope="session")
+def weather_df():
+    """Ten hourly samples of constant wind and temperature; treat as read-only."""
+    return pd.DataFrame({
+        'datetime': pd.date_range('2024-01-01', periods=10, freq='h'),
+        'wind_speed': np.full(10, 10.0, dtype=np.float32),
+        'wind_dir': np.full(10, 180, dtype=np.int16),
+        'temperature': np.full(10, 20.0, dtype=np.float32)
+    })
+
+
+@pytest.fixture
+def cli():
+    """Fresh CLI with default settings (tests may replace its services)."""
+    return WindguruCLI()
+
+
+def _configure_auth(auth, *, login_success=True, validate=True, establish=True,
+                    creds=None, error=None, record_calls=True):
+    """
+    Set the results of the mocked AuthService methods the CLI calls.
+
+    Args:
+        auth: Mocked AuthService instance
+        login_success: Whether login() succeeds
+        validate: Result of validate_credentials()
+        establish: Result of establish_session()
+        creds: Credentials returned by a successful login()
+        error: Error of a failed login()
+        record_calls: Keep the methods as mocks so tests can assert on their calls;
+            pass False to install plain stubs when only the results matter
+    """
+    response = LoginResponse(
+        success=login_success,
+        message="Login successful" if login_success else "Login failed",
+        credentials=creds,
+        error=error
+    )
+    if record_calls:
+        auth.login.return_value = response
+        auth.validate_credentials.return_value = validate
+        auth.establish_session.return_value = establish
+    else:
+        auth.login = lambda *args, **kwargs: response
+        auth.validate_credentials = lambda *args, **kwargs: validate
+        auth.establish_session = lambda *args, **kwargs: establish
+
+
+@pytest.fixture
+def cli_mocks(monkeypatch):
+    """
+    Replace the credential prompt, auth service and credential storage used by the CLI.
+
+    Returns:
+        Namespace with the prompt, storage and AuthService class mocks, plus
+        auth: the AuthService instance the CLI will create, and
+        configure_auth(**results): sets its method results (see _configure_auth)
+    """
+    prompt = MagicMock()
+    auth = MagicMock(spec=AuthService)
+    auth_cls = MagicMock(spec=AuthService, return_value=auth)
+    storage = MagicMock(spec=CredentialStorage)
+    monkeypatch.setattr('src.cli.app.CredentialsPrompt.prompt', prompt)
+    monkeypatch.setattr('src.cli.app.AuthService', auth_cls)
+    monkeypatch.setattr('src.cli.app.CredentialStorage', storage)
+    return SimpleNamespace(
+        prompt=prompt,
+        auth_cls=auth_cls,
+        storage=storage,
+        auth=auth,
+        configure_auth=partial(_configure_auth, auth)
+    )
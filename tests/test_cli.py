@@ -1,80 +1,71 @@
 """
 Tests for CLI components.
 """
-from unittest.mock import MagicMock, Mock, patch
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from src.cli.app import WindguruCLI
 from src.cli.formatter import CLIFormatter
+from src.cli.prompts import ModelPrompt, SpotPrompt
+from src.config.constants import WEATHER_MODEL_OBJECTS
 from src.config.settings import Settings
-from src.models.auth import AuthCredentials
+from src.models.spot import Spot, SpotSearchResult
+from src.services.spot_service import SpotService
+
+# Separator lines the formatter draws for the widths used below
+_EQ20, _DASH20, _EQ30 = "=" * 20, "-" * 20, "=" * 30
+
+
+@pytest.fixture(scope="module")
+def formatter():
+    """Shared formatter; CLIFormatter keeps no state."""
+    return CLIFormatter()
 
 
 class TestCLIFormatter:
     """Tests for CLIFormatter."""
 
-    def test_header(self):
+    def test_header(self, formatter):
         """Test creating header."""
-        formatter = CLIFormatter()
         result = formatter.header("TEST", width=20)
 
         assert "TEST" in result
-        assert "=" * 20 in result
+        assert _EQ20 in result
 
-    def test_subheader(self):
+    def test_subheader(self, formatter):
         """Test creating subheader."""
-        formatter = CLIFormatter()
         result = formatter.subheader("TEST", width=20)
 
         assert "TEST" in result
-        assert "-" * 20 in result
-
-    def test_success(self):
-        """Test success message."""
-        formatter = CLIFormatter()
-        result = formatter.success("Operation completed")
-
-        assert "✅" in result
-        assert "Operation completed" in result
-
-    def test_error(self):
-        """Test error message."""
-        formatter = CLIFormatter()
-        result = formatter.error("Something went wrong")
-
-        assert "❌" in result
-        assert "Something went wrong" in result
-
-    def test_info(self):
-        """Test info message."""
-        formatter = CLIFormatter()
-        result = formatter.info("Information")
-
-        assert "ℹ️" in result
-        assert "Information" in result
-
-    def test_working(self):
-        """Test working message."""
-        formatter = CLIFormatter()
-        result = formatter.working("Processing...")
-
-        assert "🔄" in result
-        assert "Processing..." in result
-
-    def test_section_break(self):
+        assert _DASH20 in result
+
+    @pytest.mark.parametrize("method,emoji,message", [
+        ("success", "✅", "Operation completed"),
+        ("error", "❌", "Something went wrong"),
+        ("info", "ℹ️", "Information"),
+        ("working", "🔄", "Processing..."),
+    ])
+    def test_status_message(self, formatter, method, emoji, message):
+        """Test status messages carry their emoji and text."""
+        result = getattr(formatter, method)(message)
+
+        assert emoji in result
+        assert message in result
+
+    def test_section_break(self, formatter):
         """Test section break."""
-        formatter = CLIFormatter()
         result = formatter.section_break(width=30)
 
-        assert "=" * 30 in result
+        assert _EQ30 in result
 
 
 class TestWindguruCLI:
     """Tests for WindguruCLI."""
 
-    def test_init_default_settings(self):
+    def test_init_default_settings(self, cli):
         """Test initializing CLI with default settings."""
-        cli = WindguruCLI()
-
         assert cli.settings is not None
         assert cli.fmt is not None
         assert cli.credentials is None
@@ -87,104 +78,105 @@ class TestWindguruCLI:
 
         assert cli.settings.verbose is True
 
-    def test_print_banner(self, capsys):
+    def test_cache_follows_output_dir(self, tmp_path):
+        """Test the archive cache lives under a custom output directory."""
+        cli = WindguruCLI(Settings(output_dir=tmp_path))
+
+        assert cli.cache.cache_dir == tmp_path / '.cache'
+
+    def test_print_banner(self, cli):
         """Test printing banner."""
-        cli = WindguruCLI()
+        cli._stdout = StringIO()
+
         cli.print_banner()
 
-        captured = capsys.readouterr()
-        assert "WINDGURU DATA ANALYZER" in captured.out
-        assert "🌊" in captured.out
+        output = cli._stdout.getvalue()
+        assert "WINDGURU DATA ANALYZER" in output
+        assert "🌊" in output
 
-    @patch('src.cli.app.CredentialsPrompt.prompt')
-    @patch('src.cli.app.AuthService')
-    def test_authenticate_auto_success(self, mock_auth_service_class, mock_prompt):
+    def test_authenticate_auto_success(self, cli, cli_mocks, sample_creds):
         """Test successful auto authentication."""
         # Setup mocks
-        mock_prompt.return_value = (
+        cli_mocks.prompt.return_value = (
             "test@example.com",
             "password",
             None,
             "auto"
         )
 
-        mock_auth_service = MagicMock()
-        mock_auth_service_class.return_value = mock_auth_service
-
-        mock_login_response = Mock()
-        mock_login_response.success = True
-        mock_login_response.credentials = AuthCredentials(
-            idu="123",
-            login_md5="abc"
-        )
-        mock_auth_service.login.return_value = mock_login_response
-        mock_auth_service.establish_session.return_value = True
+        cli_mocks.configure_auth(creds=sample_creds, record_calls=False)
 
         # Test
-        cli = WindguruCLI()
         result = cli.authenticate()
 
         assert result is True
         assert cli.credentials is not None
         assert cli.credentials.idu == "123"
 
-    @patch('src.cli.app.CredentialsPrompt.prompt')
-    @patch('src.cli.app.AuthService')
-    def test_authenticate_auto_failure(self, mock_auth_service_class, mock_prompt):
+    def test_authenticate_auto_failure(self, cli, cli_mocks):
         """Test failed auto authentication."""
         # Setup mocks
-        mock_prompt.return_value = (
+        cli_mocks.prompt.return_value = (
             "test@example.com",
             "wrong_password",
             None,
             "auto"
         )
 
-        mock_auth_service = MagicMock()
-        mock_auth_service_class.return_value = mock_auth_service
-
-        mock_login_response = Mock()
-        mock_login_response.success = False
-        mock_login_response.error = "Invalid credentials"
-        mock_auth_service.login.return_value = mock_login_response
+        cli_mocks.configure_auth(
+            login_success=False, error="Invalid credentials", record_calls=False
+        )
 
         # Test
-        cli = WindguruCLI()
         result = cli.authenticate()
 
         assert result is False
         assert cli.credentials is None
 
-    @patch('src.cli.app.CredentialsPrompt.prompt')
-    @patch('src.cli.app.AuthService')
-    def test_authenticate_manual(self, mock_auth_service_class, mock_prompt):
+    def test_authenticate_manual(self, cli, cli_mocks, sample_creds):
         """Test manual authentication."""
         # Setup mocks
-        credentials = AuthCredentials(idu="123", login_md5="abc")
-        mock_prompt.return_value = (
+        cli_mocks.prompt.return_value = (
             None,
             None,
-            credentials,
+            sample_creds,
             "manual"
         )
 
-        mock_auth_service = MagicMock()
-        mock_auth_service_class.return_value = mock_auth_service
-        mock_auth_service.establish_session.return_value = True
+        cli_mocks.configure_auth(record_calls=False)
 
         # Test
-        cli = WindguruCLI()
         result = cli.authenticate()
 
         assert result is True
-        assert cli.credentials == credentials
+        assert cli.credentials == sample_creds
+
+    def test_authenticate_passes_gzip_setting(self, cli_mocks, sample_creds, tmp_path):
+        """Test the dashboard service follows the write_gzip setting."""
+        cli = WindguruCLI(Settings(output_dir=tmp_path, write_gzip=True))
+        cli_mocks.prompt.return_value = (None, None, sample_creds, "manual")
+        cli_mocks.configure_auth(record_calls=False)
+
+        assert cli.authenticate() is True
+        assert cli.viz_service.write_gzip is True
+
+    def test_authenticate_uses_fresh_session(self, cli, cli_mocks, sample_creds):
+        """Test each login gets its own HTTP session, shared by the services."""
+        cli_mocks.prompt.return_value = (None, None, sample_creds, "manual")
+        cli_mocks.configure_auth(record_calls=False)
+
+        assert cli.authenticate() is True
+        session = cli_mocks.auth_cls.call_args.args[0]
+        assert cli.spot_service.session is session
+        assert cli.archive_service.session is session
+
+        assert cli.authenticate() is True
+        assert cli_mocks.auth_cls.call_args.args[0] is not session
 
     @patch('src.cli.app.SpotPrompt.prompt_search')
     @patch('src.cli.app.SpotPrompt.display_results')
-    def test_select_spot_success(self, mock_display, mock_search):
+    def test_select_spot_success(self, mock_display, mock_search, cli):
         """Test successful spot selection."""
-        from src.models.spot import Spot, SpotSearchResult
-
         # Setup mocks
         mock_search.return_value = "test beach"
 
@@ -192,7 +184,7 @@ class TestWindguruCLI:
         mock_display.return_value = mock_spot
 
         # Mock spot service
-        mock_spot_service = MagicMock()
+        mock_spot_service = MagicMock(spec=SpotService)
         mock_spot_service.search.return_value = SpotSearchResult(
             spots=[mock_spot],
             query="test beach",
@@ -200,7 +192,7 @@ class TestWindguruCLI:
         )
 
         # Test
-        cli = WindguruCLI()
+        cli.interactive = True
         cli.spot_service = mock_spot_service
 
         result = cli.select_spot()
@@ -208,3 +200,40 @@ class TestWindguruCLI:
         assert result == mock_spot
         mock_search.assert_called_once()
         mock_display.assert_called_once()
+
+
+class TestBatchPrompts:
+    """Tests for non-interactive prompt variants."""
+
+    @patch('builtins.input', return_value="1, 3")
+    def test_model_prompt_batch(self, mock_input):
+        """Test selecting several models from one line."""
+        result = ModelPrompt.prompt_batch()
+
+        assert result == [WEATHER_MODEL_OBJECTS[0], WEATHER_MODEL_OBJECTS[2]]
+        mock_input.assert_called_once()
+
+    @patch('builtins.input', return_value="")
+    def test_model_prompt_batch_default(self, mock_input):
+        """Test that an empty line selects the default model."""
+        assert ModelPrompt.prompt_batch() == [WEATHER_MODEL_OBJECTS[0]]
+
+    @patch('builtins.input', return_value="1,99")
+    def test_model_prompt_batch_invalid(self, mock_input):
+        """Test that an invalid entry rejects the whole line."""
+        with pytest.raises(ValueError):
+            ModelPrompt.prompt_batch()
+
+    @patch('builtins.input', return_value="2")
+    def test_spot_select_batch(self, mock_input, capsys):
+        """Test choosing a spot from one line after the list is printed."""
+        spots = [Spot(id=1, name="Beach 1"), Spot(id=2, name="Beach 2")]
+
+        assert SpotPrompt.select_batch(spots) == spots[1]
+        assert f"2. {spots[1]}" in capsys.readouterr().out
+
+    @patch('builtins.input', return_value="abc")
+    def test_spot_select_batch_invalid(self, mock_input):
+        """Test that an invalid spot choice raises instead of re-prompting."""
+        with pytest.raises(ValueError):
+            SpotPrompt.select_batch([])
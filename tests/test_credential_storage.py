@@ -1,16 +1,65 @@
 """
 Tests for credential storage service.
 """
-from unittest.mock import patch
+from typing import Optional
+from unittest.mock import MagicMock, call
+
+import pytest
 
 from src.models.auth import AuthCredentials
 from src.services.credential_storage import CredentialStorage
 
+# Keyring entries of a complete saved login, by key
+STORED_CREDENTIALS = {
+    CredentialStorage.IDU_KEY: "123",
+    CredentialStorage.LOGIN_MD5_KEY: "abc123"
+}
+
+
+@pytest.fixture(autouse=True)
+def mock_keyring(monkeypatch):
+    """Replace the keyring backend for every test in this module."""
+    keyring = MagicMock()
+    monkeypatch.setattr('src.services.credential_storage.keyring', keyring)
+    return keyring
+
+
+class FakeKeyring:
+    """Dict-backed stand-in for the keyring module, for save/read round trips."""
+
+    def __init__(self) -> None:
+        self.store: dict[tuple[str, str], str] = {}
+
+    def set_password(self, service: str, key: str, value: str) -> None:
+        self.store[(service, key)] = value
+
+    def get_password(self, service: str, key: str) -> Optional[str]:
+        return self.store.get((service, key))
+
+    def delete_password(self, service: str, key: str) -> None:
+        self.store.pop((service, key), None)
+
+    def fill(self, entries: dict[str, str]) -> None:
+        """Store entries under the CredentialStorage service name."""
+        for key, value in entries.items():
+            self.set_password(CredentialStorage.SERVICE_NAME, key, value)
+
+
+@pytest.fixture
+def fake_keyring(monkeypatch):
+    """Replace the keyring backend with an in-memory FakeKeyring."""
+    fake = FakeKeyring()
+    monkeypatch.setattr('src.services.credential_storage.keyring', fake)
+    return fake
+
 
 class TestCredentialStorage:
     """Tests for CredentialStorage service."""
 
-    @patch('src.services.credential_storage.keyring')
+    def setup_method(self):
+        """Start every test with an empty keyring cache."""
+        CredentialStorage.invalidate_cache()
+
     def test_save_username(self, mock_keyring):
         """Test saving username to keyring."""
         CredentialStorage.save_username("test@example.com")
@@ -21,7 +70,6 @@ class TestCredentialStorage:
             "test@example.com"
         )
 
-    @patch('src.services.credential_storage.keyring')
     def test_save_username_fails_silently(self, mock_keyring):
         """Test that save_username fails silently on error."""
         mock_keyring.set_password.side_effect = Exception("Keyring error")
@@ -29,7 +77,6 @@ class TestCredentialStorage:
         # Should not raise exception
         CredentialStorage.save_username("test@example.com")
 
-    @patch('src.services.credential_storage.keyring')
     def test_get_username(self, mock_keyring):
         """Test retrieving username from keyring."""
         mock_keyring.get_password.return_value = "test@example.com"
@@ -42,7 +89,6 @@ class TestCredentialStorage:
             CredentialStorage.USERNAME_KEY
         )
 
-    @patch('src.services.credential_storage.keyring')
     def test_get_username_not_found(self, mock_keyring):
         """Test retrieving username when not found."""
         mock_keyring.get_password.return_value = None
@@ -51,7 +97,6 @@ class TestCredentialStorage:
 
         assert result is None
 
-    @patch('src.services.credential_storage.keyring')
     def test_get_username_fails_silently(self, mock_keyring):
         """Test that get_username fails silently on error."""
         mock_keyring.get_password.side_effect = Exception("Keyring error")
@@ -60,26 +105,19 @@ class TestCredentialStorage:
 
         assert result is None
 
-    @patch('src.services.credential_storage.keyring')
     def test_save_credentials(self, mock_keyring):
         """Test saving credentials to keyring."""
         credentials = AuthCredentials(idu="123", login_md5="abc123")
 
         CredentialStorage.save_credentials(credentials)
 
+        expected = [
+            call(CredentialStorage.SERVICE_NAME, key, value)
+            for key, value in STORED_CREDENTIALS.items()
+        ]
         assert mock_keyring.set_password.call_count == 2
-        mock_keyring.set_password.assert_any_call(
-            CredentialStorage.SERVICE_NAME,
-            CredentialStorage.IDU_KEY,
-            "123"
-        )
-        mock_keyring.set_password.assert_any_call(
-            CredentialStorage.SERVICE_NAME,
-            CredentialStorage.LOGIN_MD5_KEY,
-            "abc123"
-        )
+        mock_keyring.set_password.assert_has_calls(expected, any_order=True)
 
-    @patch('src.services.credential_storage.keyring')
     def test_save_credentials_with_username(self, mock_keyring):
         """Test saving credentials with username to keyring."""
         credentials = AuthCredentials(idu="123", login_md5="abc123")
@@ -93,7 +131,6 @@ class TestCredentialStorage:
             "test@example.com"
         )
 
-    @patch('src.services.credential_storage.keyring')
     def test_save_credentials_fails_silently(self, mock_keyring):
         """Test that save_credentials fails silently on error."""
         mock_keyring.set_password.side_effect = Exception("Keyring error")
@@ -102,21 +139,22 @@ class TestCredentialStorage:
         # Should not raise exception
         CredentialStorage.save_credentials(credentials)
 
-    @patch('src.services.credential_storage.keyring')
-    def test_get_credentials(self, mock_keyring):
-        """Test retrieving credentials from keyring."""
-        mock_keyring.get_password.side_effect = lambda service, key: {
-            CredentialStorage.IDU_KEY: "123",
-            CredentialStorage.LOGIN_MD5_KEY: "abc123"
-        }.get(key)
+    @pytest.mark.parametrize("idu,login_md5", [("123", "abc123"), ("456", "defghi")])
+    def test_round_trip(self, fake_keyring, idu, login_md5):
+        """Test saved credentials can be read back, detected and cleared."""
+        CredentialStorage.save_credentials(AuthCredentials(idu=idu, login_md5=login_md5))
+        CredentialStorage.invalidate_cache()
 
         result = CredentialStorage.get_credentials()
-
         assert result is not None
-        assert result.idu == "123"
-        assert result.login_md5 == "abc123"
+        assert result.idu == idu
+        assert result.login_md5 == login_md5
+        assert CredentialStorage.has_saved_credentials() is True
+
+        CredentialStorage.clear_credentials()
+        assert CredentialStorage.has_saved_credentials() is False
+        assert fake_keyring.store == {}
 
-    @patch('src.services.credential_storage.keyring')
     def test_get_credentials_not_found(self, mock_keyring):
         """Test retrieving credentials when not found."""
         mock_keyring.get_password.return_value = None
@@ -125,18 +163,14 @@ class TestCredentialStorage:
 
         assert result is None
 
-    @patch('src.services.credential_storage.keyring')
-    def test_get_credentials_partial(self, mock_keyring):
+    def test_get_credentials_partial(self, fake_keyring):
         """Test retrieving credentials when only partial data exists."""
-        mock_keyring.get_password.side_effect = lambda service, key: {
-            CredentialStorage.IDU_KEY: "123",
-        }.get(key)
+        fake_keyring.fill({CredentialStorage.IDU_KEY: "123"})
 
         result = CredentialStorage.get_credentials()
 
         assert result is None
 
-    @patch('src.services.credential_storage.keyring')
     def test_get_credentials_fails_silently(self, mock_keyring):
         """Test that get_credentials fails silently on error."""
         mock_keyring.get_password.side_effect = Exception("Keyring error")
@@ -145,26 +179,21 @@ class TestCredentialStorage:
 
         assert result is None
 
-    @patch('src.services.credential_storage.keyring')
     def test_clear_credentials(self, mock_keyring):
         """Test clearing credentials from keyring."""
         CredentialStorage.clear_credentials()
 
+        expected = [
+            call(CredentialStorage.SERVICE_NAME, key)
+            for key in (
+                CredentialStorage.USERNAME_KEY,
+                CredentialStorage.IDU_KEY,
+                CredentialStorage.LOGIN_MD5_KEY
+            )
+        ]
         assert mock_keyring.delete_password.call_count == 3
-        mock_keyring.delete_password.assert_any_call(
-            CredentialStorage.SERVICE_NAME,
-            CredentialStorage.USERNAME_KEY
-        )
-        mock_keyring.delete_password.assert_any_call(
-            CredentialStorage.SERVICE_NAME,
-            CredentialStorage.IDU_KEY
-        )
-        mock_keyring.delete_password.assert_any_call(
-            CredentialStorage.SERVICE_NAME,
-            CredentialStorage.LOGIN_MD5_KEY
-        )
+        mock_keyring.delete_password.assert_has_calls(expected, any_order=True)
 
-    @patch('src.services.credential_storage.keyring')
     def test_clear_credentials_fails_silently(self, mock_keyring):
         """Test that clear_credentials fails silently on errors."""
         mock_keyring.delete_password.side_effect = Exception("Keyring error")
@@ -172,19 +201,6 @@ class TestCredentialStorage:
         # Should not raise exception
         CredentialStorage.clear_credentials()
 
-    @patch('src.services.credential_storage.keyring')
-    def test_has_saved_credentials_true(self, mock_keyring):
-        """Test checking for saved credentials when they exist."""
-        mock_keyring.get_password.side_effect = lambda service, key: {
-            CredentialStorage.IDU_KEY: "123",
-            CredentialStorage.LOGIN_MD5_KEY: "abc123"
-        }.get(key)
-
-        result = CredentialStorage.has_saved_credentials()
-
-        assert result is True
-
-    @patch('src.services.credential_storage.keyring')
     def test_has_saved_credentials_false(self, mock_keyring):
         """Test checking for saved credentials when they don't exist."""
         mock_keyring.get_password.return_value = None
@@ -192,3 +208,25 @@ class TestCredentialStorage:
         result = CredentialStorage.has_saved_credentials()
 
         assert result is False
+
+    def test_reads_are_cached(self, mock_keyring):
+        """Test repeated lookups hit the keyring only once per entry."""
+        mock_keyring.get_password.side_effect = lambda service, key: STORED_CREDENTIALS.get(key)
+
+        assert CredentialStorage.has_saved_credentials() is True
+        assert CredentialStorage.get_credentials() is not None
+        assert CredentialStorage.has_saved_credentials() is True
+
+        assert mock_keyring.get_password.call_count == 2
+
+    def test_save_and_clear_update_cache(self, mock_keyring):
+        """Test saving fills the cache and clearing invalidates it."""
+        mock_keyring.get_password.return_value = None
+
+        CredentialStorage.save_credentials(AuthCredentials(idu="123", login_md5="abc123"))
+        assert CredentialStorage.has_saved_credentials() is True
+        mock_keyring.get_password.assert_not_called()
+
+        CredentialStorage.clear_credentials()
+        assert CredentialStorage.has_saved_credentials() is False
+        assert mock_keyring.get_password.call_count == 1
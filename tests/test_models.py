@@ -1,11 +1,14 @@
 """
 Tests for data models.
 """
+import dataclasses
+import sys
 from datetime import date
 
 import pandas as pd
 import pytest
 
+from src.config.constants import WEATHER_MODEL_OBJECTS, WEATHER_MODELS
 from src.models.archive import ArchiveRequest, ArchiveResponse
 from src.models.auth import AuthCredentials, LoginResponse
 from src.models.spot import Spot, SpotSearchResult
@@ -15,10 +18,9 @@ from src.models.weather import DateRange, WeatherData, WeatherModel
 class TestAuthCredentials:
     """Tests for AuthCredentials model."""
 
-    def test_to_cookies(self):
+    def test_to_cookies(self, session_creds):
         """Test converting credentials to cookies."""
-        creds = AuthCredentials(idu="123", login_md5="abc", session="xyz")
-        cookies = creds.to_cookies()
+        cookies = session_creds.to_cookies()
 
         assert cookies["idu"] == "123"
         assert cookies["login_md5"] == "abc"
@@ -40,22 +42,35 @@ class TestAuthCredentials:
         assert creds.session == "uvw"
         assert creds.langc == "de-"
 
+    def test_cookies_cached_and_immutable(self):
+        """Test cookies are built once and credentials cannot be modified."""
+        creds = AuthCredentials(idu="123", login_md5="abc", deviceid="dev")
+
+        assert creds.cookies is creds.cookies
+        assert creds.cookies == creds.to_cookies()
+        assert creds.cookies["deviceid"] == "dev"
+        assert "session" not in creds.cookies
+        assert creds == AuthCredentials(idu="123", login_md5="abc", deviceid="dev")
+        assert hash(creds) == hash(AuthCredentials(idu="123", login_md5="abc", deviceid="dev"))
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            creds.session = "xyz"  # type: ignore[misc]
+
 
 class TestLoginResponse:
     """Tests for LoginResponse model."""
 
-    def test_successful_login(self):
+    def test_successful_login(self, sample_creds):
         """Test successful login response."""
-        creds = AuthCredentials(idu="123", login_md5="abc")
         response = LoginResponse(
             success=True,
             message="Login successful",
-            credentials=creds
+            credentials=sample_creds
         )
 
         assert response.success is True
         assert response.message == "Login successful"
-        assert response.credentials == creds
+        assert response.credentials == sample_creds
         assert response.error is None
 
     def test_failed_login(self):
@@ -82,16 +97,27 @@ class TestSpot:
         assert spot.name == "Test Beach"
         assert spot.country == "Greece"
 
-    def test_spot_string_with_country(self):
+    def test_spot_string_with_country(self, sample_spot):
         """Test string representation with country."""
-        spot = Spot(id=123, name="Test Beach", country="Greece")
-        assert str(spot) == "Greece - Test Beach (ID: 123)"
+        assert str(sample_spot) == "Greece - Test Beach (ID: 123)"
 
     def test_spot_string_without_country(self):
         """Test string representation without country."""
         spot = Spot(id=123, name="Test Beach")
         assert str(spot) == "Test Beach (ID: 123)"
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_spot_uses_slots(self):
+        """Test spot instances carry no per-instance __dict__."""
+        spot = Spot(id=123, name="Test Beach")
+        assert not hasattr(spot, '__dict__')
+
+    def test_spot_is_immutable(self, sample_spot):
+        """Test spots are frozen and hashable."""
+        assert hash(sample_spot) == hash(Spot(id=123, name="Test Beach", country="Greece"))
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            sample_spot.name = "Other Beach"  # type: ignore[misc]
+
 
 class TestSpotSearchResult:
     """Tests for SpotSearchResult model."""
@@ -126,6 +152,13 @@ class TestWeatherModel:
         assert model.name == "GFS 13km"
         assert str(model) == "GFS 13km"
 
+    def test_weather_model_is_immutable(self):
+        """Test the shared model objects are frozen and hashable."""
+        model = WEATHER_MODEL_OBJECTS[0]
+        assert hash(model) == hash(WeatherModel(**WEATHER_MODELS[0]))
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            model.name = "Other"  # type: ignore[misc]
+
 
 class TestDateRange:
     """Tests for DateRange model."""
@@ -142,9 +175,18 @@ class TestDateRange:
 
     def test_invalid_date_range(self):
         """Test that invalid date range raises error."""
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="End date must be after start date"):
             DateRange(start=date(2024, 2, 1), end=date(2024, 1, 1))
 
+    def test_date_range_is_immutable(self):
+        """Test date ranges are frozen and hashable."""
+        date_range = DateRange(start=date(2024, 1, 1), end=date(2024, 1, 1))
+
+        assert date_range.days == 1
+        assert hash(date_range) == hash(DateRange(start=date(2024, 1, 1), end=date(2024, 1, 1)))
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            date_range.end = date(2024, 1, 31)  # type: ignore[misc]
+
     def test_date_range_string(self):
         """Test date range string representation."""
         date_range = DateRange(
@@ -157,21 +199,13 @@ class TestDateRange:
 class TestWeatherData:
     """Tests for WeatherData model."""
 
-    def test_weather_data_properties(self):
+    def test_weather_data_properties(self, jan_2024_range, weather_df):
         """Test weather data properties."""
-        df = pd.DataFrame({
-            'datetime': pd.date_range('2024-01-01', periods=10, freq='h'),
-            'wind_speed': [10.0] * 10,
-            'wind_dir': [180] * 10,
-            'temperature': [20.0] * 10
-        })
-
-        date_range = DateRange(date(2024, 1, 1), date(2024, 1, 31))
         weather_data = WeatherData(
             spot_id=123,
             model_id=3,
-            date_range=date_range,
-            dataframe=df,
+            date_range=jan_2024_range,
+            dataframe=weather_df,
             spot_name="Test Beach"
         )
 
@@ -180,65 +214,93 @@ class TestWeatherData:
         assert weather_data.has_wind_direction is True
         assert weather_data.has_temperature is True
 
-    def test_summary_stats(self):
+    def test_summary_stats(self, jan_2024_range):
         """Test calculating summary statistics."""
         df = pd.DataFrame({
             'wind_speed': [10.0, 15.0, 20.0, 25.0, 30.0],
             'temperature': [15.0, 20.0, 25.0, 30.0, 35.0]
         })
 
-        date_range = DateRange(date(2024, 1, 1), date(2024, 1, 31))
         weather_data = WeatherData(
             spot_id=123,
             model_id=3,
-            date_range=date_range,
+            date_range=jan_2024_range,
+            dataframe=df
+        )
+
+        stats = weather_data.get_summary_stats()
+
+        expected = df.agg(['mean', 'min', 'max']).to_dict()
+        assert {
+            column: {key: stats[column][key] for key in ('mean', 'min', 'max')}
+            for column in expected
+        } == expected
+
+    def test_summary_stats_median_even_count(self, jan_2024_range):
+        """Test the median averages the two middle values of an even sample."""
+        df = pd.DataFrame({'wind_speed': [4.0, 1.0, None, 3.0, 2.0]})
+
+        weather_data = WeatherData(
+            spot_id=123,
+            model_id=3,
+            date_range=jan_2024_range,
+            dataframe=df
+        )
+
+        assert weather_data.get_summary_stats()['wind_speed']['median'] == 2.5
+
+    def test_summary_stats_wind_ranges(self, jan_2024_range):
+        """Test wind range percentages use left-closed boundaries."""
+        df = pd.DataFrame({'wind_speed': [5.0, 10.0, 15.0, 20.0, 30.0, None]})
+
+        weather_data = WeatherData(
+            spot_id=123,
+            model_id=3,
+            date_range=jan_2024_range,
             dataframe=df
         )
 
         stats = weather_data.get_summary_stats()
 
-        assert 'wind_speed' in stats
-        assert stats['wind_speed']['mean'] == 20.0
-        assert stats['wind_speed']['min'] == 10.0
-        assert stats['wind_speed']['max'] == 30.0
-        assert 'temperature' in stats
-        assert stats['temperature']['mean'] == 25.0
+        assert stats['wind_speed']['median'] == 15.0
+        assert stats['wind_ranges'] == {
+            '0-10_knots': 20.0,
+            '10-20_knots': 40.0,
+            '15-25_knots': 40.0,
+            '20-30_knots': 20.0,
+            '30+_knots': 20.0,
+        }
 
 
 class TestArchiveRequest:
     """Tests for ArchiveRequest model."""
 
-    def test_create_with_wind_and_temp(self):
-        """Test creating archive request with wind and temperature."""
-        date_range = DateRange(date(2024, 1, 1), date(2024, 1, 31))
+    @pytest.mark.parametrize("include_wind,include_temp,expected", [
+        (True, True, ('WINDSPD', 'WINDDIR', 'TMP')),
+        (True, False, ('WINDSPD', 'WINDDIR')),
+        (False, True, ('TMP',)),
+        (False, False, ()),
+    ])
+    def test_create(self, jan_2024_range, include_wind, include_temp, expected):
+        """Test creating archive requests for each wind/temperature combination."""
         request = ArchiveRequest.create(
             spot_id=123,
             model_id=3,
-            date_range=date_range,
-            include_wind=True,
-            include_temp=True
+            date_range=jan_2024_range,
+            include_wind=include_wind,
+            include_temp=include_temp
         )
 
         assert request.spot_id == 123
         assert request.model_id == 3
-        assert 'WINDSPD' in request.variables
-        assert 'WINDDIR' in request.variables
-        assert 'TMP' in request.variables
-
-    def test_create_wind_only(self):
-        """Test creating archive request with wind only."""
-        date_range = DateRange(date(2024, 1, 1), date(2024, 1, 31))
-        request = ArchiveRequest.create(
+        assert request.variables == expected
+        assert hash(request) == hash(ArchiveRequest.create(
             spot_id=123,
             model_id=3,
-            date_range=date_range,
-            include_wind=True,
-            include_temp=False
-        )
-
-        assert 'WINDSPD' in request.variables
-        assert 'WINDDIR' in request.variables
-        assert 'TMP' not in request.variables
+            date_range=jan_2024_range,
+            include_wind=include_wind,
+            include_temp=include_temp
+        ))
 
 
 class TestArchiveResponse:
@@ -1,18 +1,33 @@
 """
 Tests for service classes.
 """
+import base64
+import gzip
+import json
+import os
+import re
 from datetime import date
 from unittest.mock import MagicMock, Mock, patch
 
+import numpy as np
 import pandas as pd
+import pytest
 
+from src.config.constants import DEFAULT_HEADERS, MAX_TRACE_POINTS
 from src.models.archive import ArchiveRequest, ArchiveResponse
-from src.models.auth import AuthCredentials
 from src.models.weather import DateRange, WeatherData
+from src.services._http import SESSION, create_session, loads_json
 from src.services.archive_service import ArchiveService
 from src.services.auth_service import AuthService
 from src.services.spot_service import SpotService
 from src.services.visualization_service import VisualizationService
+from src.services.weather_cache import WeatherCache
+
+
+@pytest.fixture
+def mock_session():
+    """HTTP session handed to the service under test instead of patching SESSION."""
+    return MagicMock(spec=SESSION)
 
 
 class TestAuthService:
@@ -21,71 +36,74 @@ class TestAuthService:
     def test_init(self):
         """Test initializing auth service."""
         service = AuthService()
-        assert service.session is not None
+        assert service.session is SESSION
 
-    @patch('src.services.auth_service.requests.Session')
-    def test_login_success(self, mock_session_class):
-        """Test successful login."""
-        # Setup mock
-        mock_session = MagicMock()
-        mock_session_class.return_value = mock_session
+    def test_init_shared_session(self, sample_creds):
+        """Test services reuse a session passed in."""
+        session = create_session()
+
+        assert AuthService(session).session is session
+        assert SpotService(sample_creds, session).session is session
+        assert ArchiveService(sample_creds, session).session is session
+
+    def test_create_session_mounts_pooled_adapter(self):
+        """Test shared session is configured with pooling and retries."""
+        adapter = create_session().get_adapter('https://www.windguru.cz')
+
+        assert adapter._pool_maxsize == 16
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+
+    def test_create_session_sets_default_headers(self):
+        """Test default headers are applied once on the session."""
+        session = create_session()
+
+        for name, value in DEFAULT_HEADERS.items():
+            assert session.headers[name] == value
+
+    @patch('src.services._http.orjson', None)
+    def test_loads_json_stdlib_fallback(self):
+        """Test JSON bodies decode without orjson installed."""
+        assert loads_json(b'{"return": "OK"}') == {'return': 'OK'}
 
+    def test_login_success(self, mock_session):
+        """Test successful login."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            'return': 'OK',
-            'data': {
-                'id_user': 123,
-                'login_md5': 'abc123'
-            }
-        }
+        mock_response.content = b'{"return": "OK", "data": {"id_user": 123, "login_md5": "abc123"}}'
         mock_session.get.return_value = mock_response
 
         # Test
-        service = AuthService()
+        service = AuthService(mock_session)
         result = service.login("test@example.com", "password")
 
         assert result.success is True
         assert result.credentials.idu == "123"
         assert result.credentials.login_md5 == "abc123"
 
-    @patch('src.services.auth_service.requests.Session')
-    def test_login_failure(self, mock_session_class):
+    def test_login_failure(self, mock_session):
         """Test failed login."""
-        # Setup mock
-        mock_session = MagicMock()
-        mock_session_class.return_value = mock_session
-
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            'return': 'ERROR',
-            'message': 'Invalid credentials'
-        }
+        mock_response.content = b'{"return": "ERROR", "message": "Invalid credentials"}'
         mock_session.get.return_value = mock_response
 
         # Test
-        service = AuthService()
+        service = AuthService(mock_session)
         result = service.login("test@example.com", "wrong_password")
 
         assert result.success is False
         assert "Invalid credentials" in result.error
 
-    @patch('src.services.auth_service.requests.Session')
-    def test_establish_session(self, mock_session_class):
+    def test_establish_session(self, mock_session, sample_creds):
         """Test establishing session."""
-        # Setup mock
-        mock_session = MagicMock()
-        mock_session_class.return_value = mock_session
-
         mock_response = Mock()
         mock_response.status_code = 200
         mock_session.get.return_value = mock_response
 
         # Test
-        service = AuthService()
-        credentials = AuthCredentials(idu="123", login_md5="abc")
-        result = service.establish_session(credentials)
+        service = AuthService(mock_session)
+        result = service.establish_session(sample_creds)
 
         assert result is True
         mock_session.get.assert_called_once()
@@ -94,24 +112,18 @@ class TestAuthService:
 class TestSpotService:
     """Tests for SpotService."""
 
-    def test_init(self):
+    def test_init(self, sample_creds):
         """Test initializing spot service."""
-        credentials = AuthCredentials(idu="123", login_md5="abc")
-        service = SpotService(credentials)
+        service = SpotService(sample_creds)
 
-        assert service.credentials == credentials
+        assert service.credentials == sample_creds
         assert service.session is not None
 
-    @patch('src.services.spot_service.requests.Session')
-    def test_search_success(self, mock_session_class):
+    def test_search_success(self, mock_session, sample_creds):
         """Test successful spot search."""
-        # Setup mock
-        mock_session = MagicMock()
-        mock_session_class.return_value = mock_session
-
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.text = '''
+        mock_response.content = b'''
         {
             "suggestions": [
                 {"data": "123", "value": "Greece - Test Beach"},
@@ -122,8 +134,7 @@ class TestSpotService:
         mock_session.get.return_value = mock_response
 
         # Test
-        credentials = AuthCredentials(idu="123", login_md5="abc")
-        service = SpotService(credentials)
+        service = SpotService(sample_creds, mock_session)
         result = service.search("beach")
 
         assert len(result.spots) == 2
@@ -131,30 +142,23 @@ class TestSpotService:
         assert result.spots[0].name == "Greece - Test Beach"
         assert result.spots[0].country == "Greece"
 
-    @patch('src.services.spot_service.requests.Session')
-    def test_search_no_results(self, mock_session_class):
+    def test_search_no_results(self, mock_session, sample_creds):
         """Test spot search with no results."""
-        # Setup mock
-        mock_session = MagicMock()
-        mock_session_class.return_value = mock_session
-
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.text = '{"suggestions": []}'
+        mock_response.content = b'{"suggestions": []}'
         mock_session.get.return_value = mock_response
 
         # Test
-        credentials = AuthCredentials(idu="123", login_md5="abc")
-        service = SpotService(credentials)
+        service = SpotService(sample_creds, mock_session)
         result = service.search("nonexistent")
 
         assert len(result.spots) == 0
         assert result.total == 0
 
-    def test_get_spot_by_id(self):
+    def test_get_spot_by_id(self, sample_creds):
         """Test getting spot by ID."""
-        credentials = AuthCredentials(idu="123", login_md5="abc")
-        service = SpotService(credentials)
+        service = SpotService(sample_creds)
         spot = service.get_spot_by_id(123)
 
         assert spot.id == 123
@@ -164,21 +168,15 @@ class TestSpotService:
 class TestArchiveService:
     """Tests for ArchiveService."""
 
-    def test_init(self):
+    def test_init(self, sample_creds):
         """Test initializing archive service."""
-        credentials = AuthCredentials(idu="123", login_md5="abc")
-        service = ArchiveService(credentials)
+        service = ArchiveService(sample_creds)
 
-        assert service.credentials == credentials
+        assert service.credentials == sample_creds
         assert service.session is not None
 
-    @patch('src.services.archive_service.requests.Session')
-    def test_fetch_success(self, mock_session_class):
+    def test_fetch_success(self, mock_session, sample_creds):
         """Test successful archive fetch."""
-        # Setup mock
-        mock_session = MagicMock()
-        mock_session_class.return_value = mock_session
-
         mock_get_response = Mock()
         mock_get_response.status_code = 200
         mock_post_response = Mock()
@@ -189,15 +187,14 @@ class TestArchiveService:
         mock_session.post.return_value = mock_post_response
 
         # Test
-        credentials = AuthCredentials(idu="123", login_md5="abc")
-        service = ArchiveService(credentials)
+        service = ArchiveService(sample_creds, mock_session)
 
         date_range = DateRange(date(2024, 1, 1), date(2024, 1, 31))
         request = ArchiveRequest(
             spot_id=123,
             model_id=3,
             date_range=date_range,
-            variables=['WINDSPD', 'WINDDIR']
+            variables=('WINDSPD', 'WINDDIR')
         )
 
         result = service.fetch(request)
@@ -205,23 +202,186 @@ class TestArchiveService:
         assert result.success is True
         assert "archive data" in result.html_content
 
-    def test_parse_empty_response(self):
+    def test_get_weather_data_not_modified(self, mock_session, sample_creds):
+        """Test that a 304 reply returns the cached data with validators sent."""
+        mock_post_response = Mock()
+        mock_post_response.status_code = 304
+        mock_post_response.headers = {}
+        mock_session.post.return_value = mock_post_response
+
+        service = ArchiveService(sample_creds, mock_session)
+
+        date_range = DateRange(date(2024, 1, 1), date(2024, 1, 31))
+        request = ArchiveRequest(
+            spot_id=123,
+            model_id=3,
+            date_range=date_range,
+            variables=('WINDSPD',)
+        )
+        cached = WeatherData(
+            spot_id=123,
+            model_id=3,
+            date_range=date_range,
+            dataframe=pd.DataFrame({'wind_speed': [10.0]}),
+            etag='"abc"',
+            last_modified='Mon, 01 Jan 2024 00:00:00 GMT'
+        )
+
+        result = service.get_weather_data(request, cached=cached)
+
+        assert result is cached
+        headers = mock_session.post.call_args.kwargs['headers']
+        assert headers['If-None-Match'] == '"abc"'
+        assert headers['If-Modified-Since'] == 'Mon, 01 Jan 2024 00:00:00 GMT'
+
+    def test_fetch_prefetched_skips_session_request(self, mock_session, sample_creds):
+        """Test that a prefetched session is not re-established on fetch."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.text = "<html>archive data</html>"
+        mock_session.get.return_value = mock_response
+        mock_session.post.return_value = mock_response
+
+        service = ArchiveService(sample_creds, mock_session)
+
+        date_range = DateRange(date(2024, 1, 1), date(2024, 1, 31))
+        request = ArchiveRequest(
+            spot_id=123,
+            model_id=3,
+            date_range=date_range,
+            variables=('WINDSPD',)
+        )
+
+        assert service.prefetch_session(timeout=5) is True
+        result = service.fetch(request, prefetched=True)
+
+        assert result.success is True
+        mock_session.get.assert_called_once()
+
+    def test_parse_empty_response(self, sample_creds):
         """Test parsing empty response."""
-        credentials = AuthCredentials(idu="123", login_md5="abc")
-        service = ArchiveService(credentials)
+        service = ArchiveService(sample_creds)
 
         response = ArchiveResponse(html_content="", success=False)
         result = service.parse(response)
 
         assert result.empty
+        assert list(result.columns) == ['date', 'hour', 'datetime']
+        assert str(result['datetime'].dtype) == 'datetime64[ns]'
 
-    @patch('src.services.archive_service.requests.Session')
-    def test_get_weather_data(self, mock_session_class):
-        """Test getting weather data."""
-        # Setup mock
-        mock_session = MagicMock()
-        mock_session_class.return_value = mock_session
+    def test_parse_wind_direction_and_temperature(self, sample_creds):
+        """Test parsing SVG wind arrows and numeric columns."""
+        service = ArchiveService(sample_creds)
+
+        html = """
+        <table class="tabulka daily-archive">
+            <tr>
+                <td>Date</td>
+                <td colspan="2">Wind speed</td>
+                <td colspan="2">Wind direction</td>
+                <td colspan="2">Temperature</td>
+            </tr>
+            <tr><td>Header</td></tr>
+            <tr>
+                <td>02.01.2024</td>
+                <td>10</td><td>12</td>
+                <td><svg><g transform="rotate(90, 10, 10)"></g></svg></td>
+                <td><svg><g transform="rotate(370, 10, 10)"></g></svg></td>
+                <td>15.5</td><td>-</td>
+            </tr>
+        </table>
+        """
+        result = service.parse(ArchiveResponse(html_content=html, success=True))
+
+        assert list(result['wind_speed']) == [10.0, 12.0]
+        assert list(result['wind_dir']) == [90, 10]
+        assert result['temperature'].iloc[0] == 15.5
+        assert pd.isna(result['temperature'].iloc[1])
+        assert result['datetime'].iloc[1] == pd.Timestamp('2024-01-02 02:00')
+        assert [str(result[c].dtype) for c in ('wind_speed', 'wind_dir', 'temperature')] == [
+            'float32', 'int16', 'float32'
+        ]
+
+    def test_fetch_stream_parses_chunks(self, mock_session, sample_creds):
+        """Test streamed bodies are parsed chunk by chunk and then released."""
+        html = (
+            b'<table class="daily-archive"><tr><td colspan="2">Wind speed</td></tr>'
+            b'<tr><td>Header</td></tr><tr><td>01.01.2024</td><td>7</td><td>9</td></tr></table>'
+        )
+        mock_post_response = Mock()
+        mock_post_response.status_code = 200
+        mock_post_response.headers = {'Content-Type': 'text/html; charset=UTF-8'}
+        mock_post_response.encoding = 'UTF-8'
+        mock_post_response.iter_content.return_value = [html[:50], html[50:]]
+        mock_session.post.return_value = mock_post_response
+
+        service = ArchiveService(sample_creds, mock_session)
+        date_range = DateRange(date(2024, 1, 1), date(2024, 1, 1))
+        request = ArchiveRequest(spot_id=1, model_id=3, date_range=date_range, variables=('WINDSPD',))
+
+        response = service.fetch(request, prefetched=True, stream=True)
+        assert response.has_data
+        assert response.encoding == 'UTF-8'
+        assert mock_session.post.call_args.kwargs['stream'] is True
+
+        result = service.parse(response)
+
+        assert list(result['wind_speed']) == [7.0, 9.0]
+        mock_post_response.close.assert_called_once()
+
+    def test_parse_stream_releases_body_on_error(self, mock_session, sample_creds):
+        """Test a streamed body is released when parsing fails midway."""
+        mock_post_response = Mock()
+        mock_post_response.status_code = 200
+        mock_post_response.headers = {'Content-Type': 'text/html'}
+        mock_post_response.encoding = 'ISO-8859-1'
+        mock_post_response.iter_content.return_value = [b'<html>', b'<p>No table</p></html>']
+        mock_session.post.return_value = mock_post_response
+
+        service = ArchiveService(sample_creds, mock_session)
+        date_range = DateRange(date(2024, 1, 1), date(2024, 1, 1))
+        request = ArchiveRequest(spot_id=1, model_id=3, date_range=date_range, variables=('WINDSPD',))
+
+        response = service.fetch(request, prefetched=True, stream=True)
+        assert response.encoding is None
+        with pytest.raises(Exception, match="Could not find archive data table"):
+            service.parse(response)
+
+        mock_post_response.close.assert_called_once()
+
+    def test_fetch_many(self, mock_session, sample_creds):
+        """Test concurrent fetches share one session warm-up and keep order."""
+        mock_session.get.return_value = Mock(status_code=200)
+
+        def post(url, data, **kwargs):
+            spot_id = dict(data)['id_spot']
+            return Mock(status_code=200, text=f"<html>{spot_id}</html>", headers={})
+
+        mock_session.post.side_effect = post
+
+        service = ArchiveService(sample_creds, mock_session)
+        date_range = DateRange(date(2024, 1, 1), date(2024, 1, 31))
+        requests = [
+            ArchiveRequest(spot_id=spot_id, model_id=3, date_range=date_range, variables=('WINDSPD',))
+            for spot_id in (1, 2, 3)
+        ]
+
+        results = service.fetch_many(requests, max_workers=3)
 
+        assert [r.html_content for r in results] == ["<html>1</html>", "<html>2</html>", "<html>3</html>"]
+        mock_session.get.assert_called_once()
+        assert mock_session.post.call_count == 3
+
+    def test_parse_missing_table(self, sample_creds):
+        """Test parsing HTML without the archive table."""
+        service = ArchiveService(sample_creds)
+
+        response = ArchiveResponse(html_content="<p>Login required</p>", success=True)
+        with pytest.raises(Exception, match="Could not find archive data table"):
+            service.parse(response)
+
+    def test_get_weather_data(self, mock_session, sample_creds):
+        """Test getting weather data."""
         # Mock HTML with simple table structure
         mock_html = """
         <table class="daily-archive">
@@ -238,21 +398,22 @@ class TestArchiveService:
         mock_get_response.status_code = 200
         mock_post_response = Mock()
         mock_post_response.status_code = 200
-        mock_post_response.text = mock_html
+        mock_post_response.headers = {}
+        mock_post_response.encoding = None
+        mock_post_response.iter_content.return_value = [mock_html.encode()]
 
         mock_session.get.return_value = mock_get_response
         mock_session.post.return_value = mock_post_response
 
         # Test
-        credentials = AuthCredentials(idu="123", login_md5="abc")
-        service = ArchiveService(credentials)
+        service = ArchiveService(sample_creds, mock_session)
 
         date_range = DateRange(date(2024, 1, 1), date(2024, 1, 31))
         request = ArchiveRequest(
             spot_id=123,
             model_id=3,
             date_range=date_range,
-            variables=['WINDSPD']
+            variables=('WINDSPD',)
         )
 
         result = service.get_weather_data(request, spot_name="Test Beach")
@@ -261,6 +422,11 @@ class TestArchiveService:
         assert result.spot_name == "Test Beach"
         assert result.spot_id == 123
 
+        # Identical request within the same session is served from the memo
+        again = service.get_weather_data(request, spot_name="Test Beach")
+        assert again is result
+        assert mock_session.post.call_count == 1
+
 
 class TestVisualizationService:
     """Tests for VisualizationService."""
@@ -306,3 +472,217 @@ class TestVisualizationService:
         content = result.read_text()
         assert len(content) > 0
         assert "plotly" in content.lower()
+        assert "Avg: 15.2 knots" in content
+        # orjson writes the degree sign verbatim, the json module escapes it
+        assert re.search(r"Avg: 21\.5(°|\\u00b0)C", content)
+        assert re.findall(r'"name":"(Wind Speed|Temperature)".*?"type":"(\w+)"', content) == [
+            ('Wind Speed', 'scattergl'), ('Temperature', 'scattergl')
+        ]
+
+        # Initial y ranges are set explicitly and include the fill baseline
+        ranges = re.findall(r'"yaxis2?":\{"anchor".*?"range":\[([^\]]+)\]', content)
+        assert [[float(v) for v in r.split(",")] for r in ranges] == [
+            [0.0, pytest.approx(23.1)], [0.0, pytest.approx(25.2)]
+        ]
+
+        # Zoom-average script targets the rendered plot div
+        div_id = re.search(r'<div id="([^"]+)" class="plotly-graph-div"', content).group(1)
+        assert f"getElementById('{div_id}')" in content
+        assert content.index(div_id) < content.index("plotly_relayout") < content.index("</body>")
+
+    def test_create_dashboard_without_dynamic_averages(self, tmp_path):
+        """Test the zoom-average script can be left out."""
+        service = VisualizationService(tmp_path / "output", enable_dynamic_averages=False)
+
+        df = pd.DataFrame({
+            'datetime': pd.date_range('2024-01-01', periods=3, freq='h'),
+            'wind_speed': [10.0, 12.0, 14.0],
+        })
+        weather_data = WeatherData(
+            spot_id=123,
+            model_id=3,
+            date_range=DateRange(date(2024, 1, 1), date(2024, 1, 1)),
+            dataframe=df
+        )
+
+        content = service.create_dashboard(weather_data).read_text()
+
+        assert "Avg: 12.0 knots" in content
+        assert "plotly_relayout" not in content
+
+    def test_create_dashboard_gzip(self, tmp_path):
+        """Test a compressed copy is written next to the dashboard."""
+        service = VisualizationService(tmp_path / "output", write_gzip=True)
+
+        df = pd.DataFrame({
+            'datetime': pd.date_range('2024-01-01', periods=3, freq='h'),
+            'wind_speed': [10.0, 12.0, 14.0],
+        })
+        weather_data = WeatherData(
+            spot_id=123,
+            model_id=3,
+            date_range=DateRange(date(2024, 1, 1), date(2024, 1, 1)),
+            dataframe=df
+        )
+
+        result = service.create_dashboard(weather_data)
+        gz_file = result.with_name(result.name + ".gz")
+
+        with gzip.open(gz_file, 'rt', encoding='utf-8') as f:
+            assert f.read() == result.read_text(encoding='utf-8')
+
+    def test_create_dashboard_reuses_identical_render(self, tmp_path):
+        """Test identical inputs return the existing file without re-rendering."""
+        service = VisualizationService(tmp_path / "output")
+
+        def make_data(speeds):
+            df = pd.DataFrame({
+                'datetime': pd.date_range('2024-01-01', periods=3, freq='h'),
+                'wind_speed': speeds,
+            })
+            return WeatherData(
+                spot_id=123,
+                model_id=3,
+                date_range=DateRange(date(2024, 1, 1), date(2024, 1, 1)),
+                dataframe=df,
+                spot_name="Test Beach"
+            )
+
+        first = service.create_dashboard(make_data([10.0, 12.0, 14.0]))
+
+        with patch('plotly.io.to_html') as mock_to_html:
+            again = service.create_dashboard(make_data([10.0, 12.0, 14.0]))
+        assert again == first
+        mock_to_html.assert_not_called()
+
+        other = service.create_dashboard(make_data([10.0, 12.0, 15.0]))
+        assert other != first
+        assert other.exists()
+
+        with patch('src.services.visualization_service._RENDER_VERSION', -1):
+            assert service.create_dashboard(make_data([10.0, 12.0, 14.0])) != first
+        gzipped = VisualizationService(tmp_path / "output", write_gzip=True)
+        assert gzipped.create_dashboard(make_data([10.0, 12.0, 14.0])) != first
+
+    def test_create_dashboard_averages_full_series(self, tmp_path):
+        """Test the zoom-average script gets bounded bin sums of every sample."""
+        service = VisualizationService(tmp_path / "output")
+
+        total = 20 * MAX_TRACE_POINTS
+        speeds = np.arange(total, dtype=np.float64) % 37
+        speeds[10] = np.nan
+        df = pd.DataFrame({
+            'datetime': pd.date_range('2024-01-01', periods=total, freq='h'),
+            'wind_speed': speeds,
+        })
+        weather_data = WeatherData(
+            spot_id=123,
+            model_id=3,
+            date_range=DateRange(date(2024, 1, 1), date(2028, 7, 24)),
+            dataframe=df
+        )
+
+        content = service.create_dashboard(weather_data).read_text()
+
+        encoded = json.loads(re.search(r'var encoded = (\{.*?\});', content).group(1))
+
+        def decode(text, dtype):
+            return np.frombuffer(base64.b64decode(text), dtype=dtype)
+
+        times = decode(encoded['x'], '<f8')
+        sums = decode(encoded['columns']['wind_speed']['sum'], '<f4')
+        counts = decode(encoded['columns']['wind_speed']['count'], '<f4')
+        assert len(times) == MAX_TRACE_POINTS + 1
+        assert len(sums) == len(counts) == MAX_TRACE_POINTS
+        assert times[1] - times[0] == 20 * 3600 * 1000
+        assert counts[0] == 19
+        assert counts.sum() == total - 1
+        assert sums.sum() / counts.sum() == pytest.approx(np.nanmean(speeds))
+
+    def test_create_dashboard_direction_arrows(self, tmp_path):
+        """Test one direction arrow is drawn per sampled point."""
+        service = VisualizationService(tmp_path / "output")
+
+        df = pd.DataFrame({
+            'datetime': pd.date_range('2024-01-01', periods=90, freq='h'),
+            'wind_speed': [12.0] * 90,
+            'wind_dir': [270] * 90,
+        })
+        weather_data = WeatherData(
+            spot_id=123,
+            model_id=3,
+            date_range=DateRange(date(2024, 1, 1), date(2024, 1, 4)),
+            dataframe=df
+        )
+
+        content = service.create_dashboard(weather_data).read_text()
+
+        # 90 samples thinned to every 3rd point
+        assert content.count('"ayref":"pixel"') == 30
+
+
+class TestWeatherCache:
+    """Tests for WeatherCache."""
+
+    def _make_request(self):
+        date_range = DateRange(date(2024, 1, 1), date(2024, 1, 31))
+        return ArchiveRequest.create(spot_id=123, model_id=3, date_range=date_range)
+
+    def _make_weather_data(self, request):
+        df = pd.DataFrame({'wind_speed': [10.0, 12.0], 'temperature': [20.0, 21.0]})
+        return WeatherData(
+            spot_id=request.spot_id,
+            model_id=request.model_id,
+            date_range=request.date_range,
+            dataframe=df,
+            spot_name="Test Beach"
+        )
+
+    def test_key_depends_on_request(self):
+        """Test that different requests map to different keys."""
+        request = self._make_request()
+        other = ArchiveRequest.create(spot_id=456, model_id=3, date_range=request.date_range)
+
+        assert WeatherCache.key_for(request) == WeatherCache.key_for(self._make_request())
+        assert WeatherCache.key_for(request) != WeatherCache.key_for(other)
+
+    def test_save_and_load(self, tmp_path):
+        """Test round-tripping weather data through the cache."""
+        cache = WeatherCache(tmp_path / "cache", ttl_seconds=3600)
+        request = self._make_request()
+
+        assert cache.load(request) is None
+
+        cache.save(request, self._make_weather_data(request))
+        result = cache.load(request)
+
+        assert result is not None
+        assert result.spot_name == "Test Beach"
+        assert result.record_count == 2
+
+    def test_stale_entry(self, tmp_path):
+        """Test that entries older than the TTL are stale but still loadable."""
+        cache = WeatherCache(tmp_path / "cache", ttl_seconds=5)
+        request = self._make_request()
+
+        assert cache.is_fresh(request) is False
+
+        cache.save(request, self._make_weather_data(request))
+        assert cache.is_fresh(request) is True
+
+        path = cache.path_for(request)
+        os.utime(path, (path.stat().st_atime, path.stat().st_mtime - 10))
+
+        assert cache.is_fresh(request) is False
+        assert cache.load(request) is not None
+
+        cache.touch(request)
+        assert cache.is_fresh(request) is True
+
+    def test_load_corrupt_entry(self, tmp_path):
+        """Test that unreadable entries are treated as a cache miss."""
+        cache = WeatherCache(tmp_path, ttl_seconds=3600)
+        request = self._make_request()
+        cache.path_for(request).write_bytes(b"not a pickle")
+
+        assert cache.load(request) is None
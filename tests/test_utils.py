@@ -3,52 +3,49 @@ Tests for utility functions.
 """
 from datetime import date
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from src.models.weather import DateRange, WeatherData
 from src.utils.date_utils import get_last_day_of_month, parse_date_input, parse_date_range_input
+from src.utils.downsample_utils import bin_edges, lttb_indices, minmax_indices
 from src.utils.file_utils import ensure_dir, generate_safe_filename
-from src.utils.stats_utils import format_stats, print_weather_stats
+from src.utils.stats_utils import format_stats, iter_stats, print_weather_stats
 
 
 class TestDateUtils:
     """Tests for date utility functions."""
 
-    def test_parse_date_input_yyyy_mm(self):
-        """Test parsing YYYY-MM format."""
-        result = parse_date_input("2024-05")
-        assert result == date(2024, 5, 1)
-
-    def test_parse_date_input_yyyy_mm_dd(self):
-        """Test parsing YYYY-MM-DD format."""
-        result = parse_date_input("2024-05-15")
-        assert result == date(2024, 5, 15)
+    @pytest.mark.parametrize("text,expected", [
+        ("2024-05", date(2024, 5, 1)),
+        ("2024-05-15", date(2024, 5, 15)),
+    ])
+    def test_parse_date_input(self, text, expected):
+        """Test parsing YYYY-MM and YYYY-MM-DD formats."""
+        assert parse_date_input(text) == expected
 
     def test_parse_date_input_invalid(self):
         """Test parsing invalid date format."""
         with pytest.raises(ValueError):
             parse_date_input("2024/05/15")
 
-    def test_get_last_day_of_month_regular(self):
-        """Test getting last day of a regular month."""
-        result = get_last_day_of_month(2024, 1)
-        assert result == date(2024, 1, 31)
-
-    def test_get_last_day_of_month_february_leap(self):
-        """Test getting last day of February in leap year."""
-        result = get_last_day_of_month(2024, 2)
-        assert result == date(2024, 2, 29)
-
-    def test_get_last_day_of_month_february_non_leap(self):
-        """Test getting last day of February in non-leap year."""
-        result = get_last_day_of_month(2023, 2)
-        assert result == date(2023, 2, 28)
-
-    def test_get_last_day_of_month_december(self):
-        """Test getting last day of December."""
-        result = get_last_day_of_month(2024, 12)
-        assert result == date(2024, 12, 31)
+    def test_parse_date_input_out_of_range(self):
+        """Test well-formed but impossible dates are rejected."""
+        with pytest.raises(ValueError, match="Invalid date format: 2024-02-30"):
+            parse_date_input("2024-02-30")
+        with pytest.raises(ValueError):
+            parse_date_input("2024-13")
+
+    @pytest.mark.parametrize("year,month,expected", [
+        (2024, 1, date(2024, 1, 31)),   # regular month
+        (2024, 2, date(2024, 2, 29)),   # February, leap year
+        (2023, 2, date(2023, 2, 28)),   # February, non-leap year
+        (2024, 12, date(2024, 12, 31)),  # December
+    ])
+    def test_get_last_day_of_month(self, year, month, expected):
+        """Test getting the last day of a month."""
+        assert get_last_day_of_month(year, month) == expected
 
     def test_parse_date_range_input_full_dates(self):
         """Test parsing date range with full dates."""
@@ -90,6 +87,11 @@ class TestFileUtils:
         assert "/" not in result
         assert "@" not in result
 
+    def test_generate_safe_filename_non_ascii(self):
+        """Test non-ASCII spot names keep their letters and drop punctuation."""
+        assert generate_safe_filename("Pärnu, Estonia").startswith("Pärnu_Estonia_")
+        assert generate_safe_filename("Leucate - La Franqui").startswith("Leucate_La_Franqui_")
+
     def test_generate_safe_filename_with_suffix(self):
         """Test generating safe filename with suffix."""
         result = generate_safe_filename("Test Beach", suffix="dashboard")
@@ -110,6 +112,43 @@ class TestFileUtils:
         assert result == test_dir
 
 
+class TestDownsampleUtils:
+    """Tests for downsampling utility functions."""
+
+    def test_lttb_short_series_unchanged(self):
+        """Test series at or below the target size are kept whole."""
+        y = np.arange(5.0)
+        assert lttb_indices(np.arange(5), y, 10).tolist() == [0, 1, 2, 3, 4]
+
+    def test_lttb_keeps_endpoints_and_peaks(self):
+        """Test downsampling keeps the endpoints and isolated spikes."""
+        x = pd.date_range('2024-01-01', periods=1000, freq='h').to_numpy()
+        y = np.zeros(1000)
+        y[337] = 40.0
+
+        keep = lttb_indices(x, y, 50)
+
+        assert len(keep) == 50
+        assert keep[0] == 0
+        assert keep[-1] == 999
+        assert 337 in keep
+        assert np.all(np.diff(keep) > 0)
+
+    def test_minmax_keeps_bin_extremes(self):
+        """Test min/max binning keeps each bin's extremes and skips NaNs."""
+        y = np.array([1.0, 9.0, 5.0, np.nan, 3.0, 0.0, 7.0, 2.0])
+
+        keep = minmax_indices(y, 4)
+
+        assert keep.tolist() == [0, 1, 5, 6]
+        assert minmax_indices(y, 8).tolist() == list(range(8))
+
+    def test_bin_edges_cover_all_samples(self):
+        """Test bins split the samples evenly without gaps or empty bins."""
+        assert bin_edges(10, 4).tolist() == [0, 2, 5, 7, 10]
+        assert bin_edges(3, 3).tolist() == [0, 1, 2, 3]
+
+
 class TestStatsUtils:
     """Tests for statistics utility functions."""
 
@@ -165,6 +204,21 @@ class TestStatsUtils:
         assert "FAVORABLE CONDITIONS" in result
         assert "10-20 knots: 45.5%" in result
 
+    def test_iter_stats_lines(self):
+        """Test stats are yielded line by line with a blank line between sections."""
+        stats = {
+            'wind_speed': {'mean': 15.5, 'median': 14.0, 'min': 5.0, 'max': 30.0},
+            'temperature': {'mean': 22.5, 'median': 23.0, 'min': 15.0, 'max': 30.0},
+        }
+
+        lines = list(iter_stats(stats))
+
+        assert lines[0] == "WIND SPEED (knots)"
+        assert lines[5] == ""
+        assert lines[6] == "TEMPERATURE (°C)"
+        assert lines[-1] == "  Max:     30.0"
+        assert "\n".join(lines) == format_stats(stats)
+
     def test_print_weather_stats(self, capsys):
         """Test printing weather stats."""
         df = pd.DataFrame({
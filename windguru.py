@@ -15,15 +15,6 @@ Or make executable and run directly:
     ./windguru.py
 """
 import sys
-from pathlib import Path
-
-# Add src to path
-src_path = Path(__file__).parent / 'src'
-sys.path.insert(0, str(src_path))
-
-from src.cli.app import WindguruCLI
-from src.tui.app import run_tui
-from src.config.settings import Settings
 
 
 def main() -> None:
@@ -32,8 +23,11 @@ def main() -> None:
     use_cli = '--cli' in sys.argv
     use_tui = '--tui' in sys.argv or (not use_cli)  # TUI is default
 
+    # Each interface is imported only when chosen, so startup skips the other's dependencies
     if use_tui:
         # Run modern TUI
+        from src.tui.app import run_tui
+
         try:
             run_tui()
         except KeyboardInterrupt:
@@ -41,6 +35,9 @@ def main() -> None:
             sys.exit(0)
     else:
         # Run classic CLI
+        from src.cli.app import WindguruCLI
+        from src.config.settings import Settings
+
         settings = Settings.load()
         cli = WindguruCLI(settings)
         cli.run()